@@ -1,16 +1,17 @@
-"""Aggregate metrics from 1D and Panda experiment JSON outputs."""
+"""Aggregate metrics from 1D and Panda experiment JSON/NDJSON outputs."""
 
 from __future__ import annotations
 
 import json
+from itertools import chain
+from operator import itemgetter
 from pathlib import Path
-from statistics import mean
-from typing import Iterable
+from typing import Callable, Iterable
 
 RESULT_FILES = [
     Path("results/language_pipeline.json"),
     Path("results/panda_pipeline.json"),
-    Path("results/panda_full_batch.json"),
+    Path("results/panda_full_batch.ndjson"),
 ]
 
 
@@ -18,36 +19,61 @@ def load_entries(path: Path) -> list:
     if not path.exists():
         return []
     with path.open("r", encoding="utf-8") as fh:
+        if path.suffix == ".ndjson":
+            return [json.loads(line) for line in fh if line.strip()]
         return json.load(fh)
 
 
-def _extract_metric(entry: dict) -> dict:
-    if "metrics_1d" in entry:
-        return entry["metrics_1d"]
-    if "metrics" in entry:
-        return entry["metrics"]
-    return {
-        "success": entry.get("success", False),
-        "final_depth_m": entry.get("final_depth_m", 0.0),
-        "goal_depth_m": entry.get("goal_depth_m", 0.0),
-    }
+def _metric_extractor(sample: dict) -> Callable[[dict], dict]:
+    """Pick the metric accessor for a result file from its first entry.
+
+    Each script writes a single schema per file, so the dispatch only needs to
+    happen once. Flat entries (language_pipeline.json) already carry the metric
+    keys at the top level and are used as-is.
+    """
+
+    if "metrics_1d" in sample:
+        return itemgetter("metrics_1d")
+    if "metrics" in sample:
+        return itemgetter("metrics")
+    return _identity
+
+
+def _identity(entry: dict) -> dict:
+    return entry
 
 
 def summarize(entries: Iterable[dict]) -> dict:
-    entries = list(entries)
-    if not entries:
+    count = successes = 0
+    depth_error_sum = 0.0
+    panda_depth_sum = panda_force_sum = 0.0
+    panda_depth_count = panda_force_count = 0
+    iterator = iter(entries)
+    first = next(iterator, None)
+    if first is None:
         return {}
-    metrics = [_extract_metric(e) for e in entries]
-    success_rate = mean(1.0 if m.get("success", False) else 0.0 for m in metrics)
-    depth_errors = [abs(m.get("goal_depth_m", 0.0) - m.get("final_depth_m", 0.0)) for m in metrics]
-    panda_depths = [e.get("panda_final_depth_m") for e in entries if e.get("panda_final_depth_m") is not None]
-    panda_forces = [e.get("panda_final_force_N") for e in entries if e.get("panda_final_force_N") is not None]
+    extract_metric = _metric_extractor(first)
+    for entry in chain((first,), iterator):
+        metric_get = extract_metric(entry).get
+        entry_get = entry.get
+        count += 1
+        if metric_get("success", False):
+            successes += 1
+        depth_error_sum += abs(metric_get("goal_depth_m", 0.0) - metric_get("final_depth_m", 0.0))
+        panda_depth = entry_get("panda_final_depth_m")
+        if panda_depth is not None:
+            panda_depth_sum += panda_depth
+            panda_depth_count += 1
+        panda_force = entry_get("panda_final_force_N")
+        if panda_force is not None:
+            panda_force_sum += panda_force
+            panda_force_count += 1
     return {
-        "count": len(entries),
-        "success_rate_1d": success_rate,
-        "avg_depth_error_1d": mean(depth_errors),
-        "avg_panda_depth": mean(p for p in panda_depths) if panda_depths else None,
-        "avg_panda_force": mean(p for p in panda_forces) if panda_forces else None,
+        "count": count,
+        "success_rate_1d": successes / count,
+        "avg_depth_error_1d": depth_error_sum / count,
+        "avg_panda_depth": panda_depth_sum / panda_depth_count if panda_depth_count else None,
+        "avg_panda_force": panda_force_sum / panda_force_count if panda_force_count else None,
     }
 
 
@@ -60,7 +86,8 @@ def main() -> None:
         summary[result_file.name] = summarize(entries)
 
     out_path = Path("results/summary.json")
-    out_path.write_text(json.dumps(summary, indent=2), encoding="utf-8")
+    with out_path.open("w", encoding="utf-8") as fh:
+        json.dump(summary, fh, indent=2)
     print(f"Wrote aggregate metrics to {out_path}")
     for name, stats in summary.items():
         print(name, stats)
@@ -0,0 +1,30 @@
+"""Keep one LanguageToActionPipeline warm and serve instructions from stdin.
+
+Each non-empty input line is treated as one instruction; one JSON summary per
+line is written to stdout, e.g.::
+
+    PYTHONPATH=src python scripts/pipeline_server.py < instructions.txt > results.ndjson
+"""
+
+from __future__ import annotations
+
+import json
+import sys
+
+from lang2mech_ir.pipeline import LanguageToActionPipeline
+from run_language_pipeline import summarize_result
+
+
+def main() -> None:
+    pipeline = LanguageToActionPipeline()
+    for line in sys.stdin:
+        instruction = line.strip()
+        if not instruction:
+            continue
+        entry = summarize_result(pipeline.process_instruction(instruction))
+        sys.stdout.write(json.dumps(entry) + "\n")
+        sys.stdout.flush()
+
+
+if __name__ == "__main__":  # pragma: no cover - manual script
+    main()
@@ -3,9 +3,12 @@
 from __future__ import annotations
 
 import json
+from concurrent.futures import ProcessPoolExecutor
+from itertools import product
 from pathlib import Path
-from typing import List
+from typing import List, Sequence, Tuple
 
+from lang2mech_ir import MechanicsIR
 from lang2mech_ir.pipeline import LanguageToActionPipeline
 from lang2mech_ir.simulation.mujoco_runner import run_mujoco_episode
 
@@ -14,6 +17,9 @@ HOLE_CLEARANCES_MM = [0.2, 0.4]
 FORCE_LIMITS_N = [5, 10, 15, 20, 25]
 SPEED_DESCRIPTORS = ["carefully", "steadily"]  # 5*2*5*2 = 100
 
+JOINT_NAMES = [f"joint{i}" for i in range(1, 8)]
+ACTUATOR_NAMES = [f"actuator{i}" for i in range(1, 8)]
+
 
 def build_instruction(radius_mm: float, clearance_mm: float, force: float, speed_word: str) -> str:
     hole_radius_mm = radius_mm + clearance_mm
@@ -23,14 +29,32 @@ def build_instruction(radius_mm: float, clearance_mm: float, force: float, speed
     )
 
 
+# The sweep grid is fixed, so format every instruction once at import time.
+_INSTRUCTIONS: List[str] = [
+    build_instruction(radius, clearance, force, speed)
+    for radius, clearance, force, speed in product(
+        PEG_RADII_MM, HOLE_CLEARANCES_MM, FORCE_LIMITS_N, SPEED_DESCRIPTORS
+    )
+]
+
+
 def generate_instructions() -> List[str]:
-    instructions: List[str] = []
-    for radius in PEG_RADII_MM:
-        for clearance in HOLE_CLEARANCES_MM:
-            for force in FORCE_LIMITS_N:
-                for speed in SPEED_DESCRIPTORS:
-                    instructions.append(build_instruction(radius, clearance, force, speed))
-    return instructions
+    return list(_INSTRUCTIONS)
+
+
+def _run_one(payload: Tuple[dict, Sequence[float], Path]) -> Tuple[float, float, int]:
+    """Worker: run one Panda episode and return (final depth, final force, steps)."""
+
+    ir_dict, goal_positions, model_path = payload
+    panda_log = run_mujoco_episode(
+        MechanicsIR.from_dict(ir_dict),
+        model_path,
+        steps=100,
+        joint_names=JOINT_NAMES,
+        actuator_names=ACTUATOR_NAMES,
+        goal_positions=goal_positions,
+    )
+    return panda_log.positions_m[-1], panda_log.contact_forces_N[-1], len(panda_log.times_s)
 
 
 def main() -> None:
@@ -41,38 +65,39 @@ def main() -> None:
     if not model_path.exists():
         raise SystemExit("MuJoCo menagerie Panda assets missing.")
 
-    joint_names = [f"joint{i}" for i in range(1, 8)]
-    actuator_names = [f"actuator{i}" for i in range(1, 8)]
-
     pipeline = LanguageToActionPipeline()
-    all_results = []
-    for idx, instruction in enumerate(instructions, 1):
-        result = pipeline.process_instruction(instruction)
-        goal_positions = [0.0] * len(joint_names)
+    results = pipeline.run_batch(instructions)
+    ir_dicts = [result.ir.to_dict() for result in results]
+    goal_template = [0.0] * len(JOINT_NAMES)
+    payloads = []
+    for ir_dict, result in zip(ir_dicts, results):
+        goal_positions = goal_template.copy()
         goal_positions[-1] = result.ir.hole.depth_m
-        panda_log = run_mujoco_episode(
-            result.ir,
-            model_path,
-            steps=100,
-            joint_names=joint_names,
-            actuator_names=actuator_names,
-            goal_positions=goal_positions,
-        )
-        all_results.append(
-            {
+        payloads.append((ir_dict, goal_positions, model_path))
+
+    # Episodes are independent and CPU-bound; ex.map preserves input order.
+    # Each record is written as one NDJSON line as soon as it is ready, so a
+    # crash mid-sweep keeps everything finished so far.
+    output_path = Path("results/panda_full_batch.ndjson")
+    with ProcessPoolExecutor() as ex, output_path.open("w", encoding="utf-8") as fh:
+        panda_runs = ex.map(_run_one, payloads, chunksize=2)
+        for idx, (instruction, result, ir_dict, panda_run) in enumerate(
+            zip(instructions, results, ir_dicts, panda_runs), 1
+        ):
+            final_depth, final_force, steps = panda_run
+            record = {
                 "instruction": instruction,
-                "ir": result.ir.to_dict(),
+                "ir": ir_dict,
                 "metrics_1d": result.metrics.as_dict(),
-                "panda_final_depth_m": panda_log.positions_m[-1],
-                "panda_final_force_N": panda_log.contact_forces_N[-1],
-                "panda_steps": len(panda_log.times_s),
+                "panda_final_depth_m": final_depth,
+                "panda_final_force_N": final_force,
+                "panda_steps": steps,
             }
-        )
-        if idx % 5 == 0:
-            print(f"Processed {idx}/{len(instructions)} instructions...")
+            fh.write(json.dumps(record) + "\n")
+            fh.flush()
+            if idx % 5 == 0:
+                print(f"Processed {idx}/{len(instructions)} instructions...")
 
-    output_path = Path("results/panda_full_batch.json")
-    output_path.write_text(json.dumps(all_results, indent=2), encoding="utf-8")
     print(f"Saved results to {output_path}")
 
 
@@ -4,8 +4,9 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
+from typing import Any, Dict, Iterable, List
 
-from lang2mech_ir.pipeline import LanguageToActionPipeline
+from lang2mech_ir.pipeline import LanguageToActionPipeline, PipelineResult
 
 INSTRUCTIONS = [
     "Slowly insert the 10 mm peg that is 100 mm long into the hole carefully, without using more than 5 N of force.",
@@ -14,27 +15,31 @@ INSTRUCTIONS = [
 ]
 
 
+def summarize_result(res: PipelineResult) -> Dict[str, Any]:
+    return {
+        "instruction": res.instruction,
+        "max_force": res.ir.max_force.maximum,
+        "alignment_deg": res.ir.tolerances.alignment_deg,
+        "success": res.metrics.success,
+        "final_depth_m": res.metrics.final_depth_m,
+        "goal_depth_m": res.metrics.goal_depth_m,
+        "final_force_N": res.metrics.final_force_N,
+        "duration_s": res.metrics.duration_s,
+    }
+
+
+def run(instructions: Iterable[str], pipeline: LanguageToActionPipeline) -> List[Dict[str, Any]]:
+    """Run *instructions* through an existing *pipeline* and return summary entries."""
+
+    return [summarize_result(res) for res in pipeline.run_batch(instructions)]
+
+
 def main() -> None:
-    pipeline = LanguageToActionPipeline()
-    results = pipeline.run_batch(INSTRUCTIONS)
-
-    summary = []
-    for res in results:
-        summary.append(
-            {
-                "instruction": res.instruction,
-                "max_force": res.ir.max_force.maximum,
-                "alignment_deg": res.ir.tolerances.alignment_deg,
-                "success": res.metrics.success,
-                "final_depth_m": res.metrics.final_depth_m,
-                "goal_depth_m": res.metrics.goal_depth_m,
-                "final_force_N": res.metrics.final_force_N,
-                "duration_s": res.metrics.duration_s,
-            }
-        )
+    summary = run(INSTRUCTIONS, LanguageToActionPipeline())
 
     output_path = Path("results/language_pipeline.json")
-    output_path.write_text(json.dumps(summary, indent=2), encoding="utf-8")
+    with output_path.open("w", encoding="utf-8") as fh:
+        json.dump(summary, fh, indent=2)
     print(f"Wrote {output_path} with {len(summary)} entries.")
     for entry in summary:
         print(
@@ -23,12 +23,13 @@ def main() -> None:
 
     joint_names = [f"joint{i}" for i in range(1, 8)]
     actuator_names = [f"actuator{i}" for i in range(1, 8)]
+    goal_template = [0.0] * len(joint_names)
 
     pipeline = LanguageToActionPipeline()
+    batch = pipeline.run_batch(INSTRUCTIONS)
     results = []
-    for instruction in INSTRUCTIONS:
-        res = pipeline.process_instruction(instruction)
-        goal_positions = [0.0] * len(joint_names)
+    for instruction, res in zip(INSTRUCTIONS, batch):
+        goal_positions = goal_template.copy()
         goal_positions[-1] = res.ir.hole.depth_m
         panda_log = run_mujoco_episode(
             res.ir,
@@ -55,7 +56,8 @@ def main() -> None:
         )
 
     out_path = Path("results/panda_pipeline.json")
-    out_path.write_text(json.dumps(results, indent=2), encoding="utf-8")
+    with out_path.open("w", encoding="utf-8") as fh:
+        json.dump(results, fh, indent=2)
     print(f"Saved {len(results)} Panda runs to {out_path}.")
 
 
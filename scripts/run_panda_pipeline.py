@@ -22,11 +22,12 @@ def main() -> None:
 
     joint_names = [f"joint{i}" for i in range(1, 8)]
     actuator_names = [f"actuator{i}" for i in range(1, 8)]
+    goal_template = [0.0] * len(joint_names)
 
     pipeline = LanguageToActionPipeline()
     for instruction in INSTRUCTIONS:
         result = pipeline.process_instruction(instruction)
-        goal_positions = [0.0] * len(joint_names)
+        goal_positions = goal_template.copy()
         goal_positions[-1] = result.ir.hole.depth_m
         log = run_mujoco_episode(
             result.ir,
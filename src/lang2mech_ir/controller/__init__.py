@@ -7,13 +7,14 @@ from .state import (
     JointSpaceState,
     MultiJointMPCPlan,
 )
-from .mpc import PegInHoleMPC
+from .mpc import BlockMPCSolver, PegInHoleMPC
 from .multi_mpc import MultiJointMPC, MultiJointMPCConfig
 
 __all__ = [
     "PegInHoleState",
     "ControllerConfig",
     "PegInHoleMPC",
+    "BlockMPCSolver",
     "MPCPlan",
     "JointSpaceState",
     "MultiJointMPCPlan",
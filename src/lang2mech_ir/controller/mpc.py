@@ -3,26 +3,124 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from typing import List, Sequence
 
 import numpy as np
 import scipy.sparse as sp
+from scipy.linalg import toeplitz
 import osqp
 
 from ..ir_schema import MechanicsIR
 from .state import ControllerConfig, PegInHoleState, MPCPlan
 
 
+_SOLVED_STATUSES = {"solved", "solved inaccurate"}
+
+
+@dataclass
+class _QPProblem:
+    """Condensed QP for one planning step plus the data needed to unpack it."""
+
+    P: sp.csc_matrix
+    q: np.ndarray
+    A: sp.csc_matrix
+    l: np.ndarray
+    u: np.ndarray
+    base_pos: np.ndarray
+    base_vel: np.ndarray
+    pos_coeff: np.ndarray
+    vel_coeff: np.ndarray
+    depth_goal: float
+    max_force: float
+    solver_key: tuple
+
+
 @dataclass
 class PegInHoleMPC:
     """Quadratic-programming-based MPC that enforces IR-derived limits."""
 
     config: ControllerConfig = field(default_factory=ControllerConfig)
+    _solver: osqp.OSQP | None = field(default=None, init=False, repr=False, compare=False)
+    _solver_key: tuple | None = field(default=None, init=False, repr=False, compare=False)
+    _prediction_cache: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+    _matrix_cache: dict = field(default_factory=dict, init=False, repr=False, compare=False)
+    _inverse_cache: dict = field(default_factory=dict, init=False, repr=False, compare=False)
 
     def plan(self, ir: MechanicsIR, state: PegInHoleState) -> MPCPlan:
+        qp = self._build_qp(ir, state)
+
+        # When the unconstrained optimum is feasible it is the QP optimum, and
+        # it is one cached matrix-vector product away.
+        unconstrained = self._unconstrained_solution(qp)
+        if unconstrained is not None:
+            z, cost = unconstrained
+            return self._make_plan(qp, z, cost)
+
+        # P and A only depend on the controller configuration, so the KKT
+        # factorization can be reused and only the vectors refreshed.
+        if self._solver is None or self._solver_key != qp.solver_key:
+            self._solver = osqp.OSQP()
+            self._solver.setup(
+                P=qp.P, q=qp.q, A=qp.A, l=qp.l, u=qp.u, verbose=False, warm_starting=True
+            )
+            self._solver_key = qp.solver_key
+        else:
+            self._solver.update(q=qp.q, l=qp.l, u=qp.u)
+        result = self._solver.solve()
+
+        status = getattr(result.info, "status", "")
+        if status not in _SOLVED_STATUSES:
+            return self._fallback_plan(state)
+        return self._make_plan(qp, result.x, result.info.obj_val)
+
+    def _unconstrained_solution(self, qp: _QPProblem) -> tuple[np.ndarray, float] | None:
+        """Return ``(z, cost)`` if the unconstrained minimizer satisfies every constraint."""
+
+        inverse = self._inverse_cache.get(qp.solver_key)
+        if inverse is None:
+            H = qp.base_pos.size
+            inverse = self._inverse_cache[qp.solver_key] = np.linalg.inv(qp.P[:H, :H].toarray())
+
+        # Slack variables carry no linear cost, so their unconstrained optimum is 0.
+        z = np.zeros(qp.q.size)
+        z[: inverse.shape[0]] = -(inverse @ qp.q[: inverse.shape[0]])
+        Az = qp.A @ z
+        if not (np.all(Az >= qp.l) and np.all(Az <= qp.u)):
+            return None
+        return z, 0.5 * float(z @ (qp.P @ z)) + float(qp.q @ z)
+
+    def reset(self) -> None:
+        """Cold-start the next solve, e.g. at the beginning of a new episode.
+
+        The cached solver (and its factorization) is kept; only the previous
+        primal/dual iterate used for warm starting is zeroed.
+        """
+
+        if self._solver is None:
+            return
+        horizon = self._solver_key[0]
+        self._solver.warm_start(x=np.zeros(2 * horizon), y=np.zeros(5 * horizon))
+
+    def plan_batch(self, irs: Sequence[MechanicsIR], states: Sequence[PegInHoleState]) -> List[MPCPlan]:
+        """Plan for several independent (IR, state) pairs with one block-diagonal QP.
+
+        Every instance shares this controller's configuration, so stacking them
+        lets OSQP factorize a single sparse KKT system instead of one per instance.
+        """
+
+        if len(irs) != len(states):
+            raise ValueError("irs and states must have the same length")
+        if not irs:
+            return []
+
+        return BlockMPCSolver().plan([self] * len(irs), irs, states)
+
+    def _build_qp(self, ir: MechanicsIR, state: PegInHoleState) -> _QPProblem:
+        """Assemble the condensed QP for one planning step."""
+
         horizon = self.config.horizon
         dt = self.config.timestep_s
         mass = self.config.mass_kg
-        k_spring = self.config.spring_k
 
         depth_goal = float(ir.hole.depth_m)
         max_force = float(ir.max_force.maximum or 10.0)
@@ -32,131 +130,229 @@ class PegInHoleMPC:
         )
         acc_limit = self.config.acceleration_limit_mps2
 
-        # Linear dynamics matrices for a double integrator.
-        A = np.array([[1.0, dt], [0.0, 1.0]], dtype=float)
-        B = np.array([[0.5 * dt * dt], [dt]], dtype=float)
-
-        A_powers = [np.eye(2)]
-        for _ in range(1, horizon + 1):
-            A_powers.append(A_powers[-1] @ A)
-
-        base_pos = np.zeros(horizon)
-        base_vel = np.zeros(horizon)
-        pos_coeff = np.zeros((horizon, horizon))
-        vel_coeff = np.zeros((horizon, horizon))
-
-        s0 = np.array([state.position_m, state.velocity_mps])
-        for k in range(horizon):
-            base_state = A_powers[k + 1] @ s0
-            base_pos[k] = base_state[0]
-            base_vel[k] = base_state[1]
-            for j in range(k + 1):
-                contrib = A_powers[k - j] @ B
-                pos_coeff[k, j] = contrib[0, 0]
-                vel_coeff[k, j] = contrib[1, 0]
+        elapsed, pos_coeff, vel_coeff = self._prediction_matrices(dt, horizon)
+
+        # Free response of the double integrator: A^k = [[1, k*dt], [0, 1]].
+        base_pos = state.position_m + elapsed * state.velocity_mps
+        base_vel = np.full(horizon, float(state.velocity_mps))
 
         c_pos = base_pos - depth_goal
         c_vel = base_vel
 
         H = horizon
         z_dim = 2 * H
-        P = np.zeros((z_dim, z_dim))
-        q = np.zeros(z_dim)
 
         position_weight = self.config.position_weight
         velocity_weight = self.config.velocity_weight
         control_weight = self.config.control_weight
         slack_weight = self.config.force_slack_weight
 
-        P[:H, :H] += 2.0 * (
-            position_weight * pos_coeff.T @ pos_coeff
-            + velocity_weight * vel_coeff.T @ vel_coeff
-            + control_weight * np.eye(H)
-        )
-        q[:H] += 2.0 * (
+        q = np.zeros(z_dim)
+        q[:H] = 2.0 * (
             position_weight * pos_coeff.T @ c_pos
             + velocity_weight * vel_coeff.T @ c_vel
         )
+        solver_key = (
+            horizon,
+            dt,
+            mass,
+            position_weight,
+            velocity_weight,
+            control_weight,
+            slack_weight,
+        )
+        P_mat, A_con = self._qp_matrices(solver_key, pos_coeff, vel_coeff)
 
-        # Slack penalty (diagonal block for slack variables)
-        slack_diag = 2.0 * slack_weight * np.eye(H)
-        P[H:, H:] = slack_diag
-
-        constraints_matrix_rows = []
-        lower_bounds = []
-        upper_bounds = []
-
-        def add_constraint(row, lower, upper):
-            constraints_matrix_rows.append(row)
-            lower_bounds.append(lower)
-            upper_bounds.append(upper)
-
-        # Force constraints: mass * a +/- slack <= max_force
-        for k in range(H):
-            row = np.zeros(z_dim)
-            row[k] = mass
-            row[H + k] = -1.0
-            add_constraint(row, -np.inf, max_force)
-
-            row = np.zeros(z_dim)
-            row[k] = -mass
-            row[H + k] = -1.0
-            add_constraint(row, -np.inf, max_force)
-
-        # Slack >= 0
-        for k in range(H):
-            row = np.zeros(z_dim)
-            row[H + k] = 1.0
-            add_constraint(row, 0.0, np.inf)
-
-        # Velocity limits on predicted states
-        for k in range(H):
-            row = np.zeros(z_dim)
-            row[:H] = vel_coeff[k]
-            add_constraint(row, -vel_limit - base_vel[k], vel_limit - base_vel[k])
-
-        # Acceleration limits
-        for k in range(H):
-            row = np.zeros(z_dim)
-            row[k] = 1.0
-            add_constraint(row, -acc_limit, acc_limit)
-
-        # Assemble sparse matrices for OSQP
-        A_con = sp.csc_matrix(np.vstack(constraints_matrix_rows))
-        P_mat = sp.csc_matrix(P)
-        q_vec = q
-        l_vec = np.array(lower_bounds)
-        u_vec = np.array(upper_bounds)
-
-        solver = osqp.OSQP()
-        solver.setup(P=P_mat, q=q_vec, A=A_con, l=l_vec, u=u_vec, verbose=False, warm_starting=True)
-        result = solver.solve()
+        l_vec = np.concatenate((
+            np.full(2 * H, -np.inf),
+            np.zeros(H),
+            -vel_limit - base_vel,
+            np.full(H, -acc_limit),
+        ))
+        u_vec = np.concatenate((
+            np.full(2 * H, max_force),
+            np.full(H, np.inf),
+            vel_limit - base_vel,
+            np.full(H, acc_limit),
+        ))
+        return _QPProblem(
+            P=P_mat,
+            q=q,
+            A=A_con,
+            l=l_vec,
+            u=u_vec,
+            base_pos=base_pos,
+            base_vel=base_vel,
+            pos_coeff=pos_coeff,
+            vel_coeff=vel_coeff,
+            depth_goal=depth_goal,
+            max_force=max_force,
+            solver_key=solver_key,
+        )
 
-        status = getattr(result.info, "status", "")
-        if status not in {"solved", "solved inaccurate"}:
-            return MPCPlan(control_sequence=[0.0], predicted_positions=[state.position_m], predicted_velocities=[state.velocity_mps], cost=None)
+    def _make_plan(self, qp: _QPProblem, z_sol: np.ndarray, cost: float | None) -> MPCPlan:
+        H = qp.base_pos.size
+        depth_goal = qp.depth_goal
+        max_force = qp.max_force
+        k_spring = self.config.spring_k
 
-        z_sol = result.x
         controls = z_sol[:H]
-        plan = MPCPlan(control_sequence=controls.tolist(), cost=result.info.obj_val)
-
-        pred_positions = []
-        pred_velocities = []
-        for k in range(H):
-            pos = base_pos[k] + pos_coeff[k] @ controls
-            vel = base_vel[k] + vel_coeff[k] @ controls
-            # Soft contact penalty to mimic MuJoCo's spring when past goal depth
-            if pos >= depth_goal:
-                penetration = pos - depth_goal
-                force = k_spring * penetration
-                if force > max_force:
-                    pos = depth_goal + max_force / k_spring
-            pred_positions.append(pos)
-            pred_velocities.append(vel)
-        plan.predicted_positions = pred_positions
-        plan.predicted_velocities = pred_velocities
+        plan = MPCPlan(control_sequence=controls.tolist(), cost=cost)
+
+        pred_positions = qp.base_pos + qp.pos_coeff @ controls
+        pred_velocities = qp.base_vel + qp.vel_coeff @ controls
+        # Soft contact penalty to mimic MuJoCo's spring when past goal depth
+        penetration = pred_positions - depth_goal
+        clamped = (penetration >= 0.0) & (k_spring * penetration > max_force)
+        pred_positions = np.where(clamped, depth_goal + max_force / k_spring, pred_positions)
+        plan.predicted_positions = pred_positions.tolist()
+        plan.predicted_velocities = pred_velocities.tolist()
         return plan
 
+    @staticmethod
+    def _fallback_plan(state: PegInHoleState) -> MPCPlan:
+        return MPCPlan(control_sequence=[0.0], predicted_positions=[state.position_m], predicted_velocities=[state.velocity_mps], cost=None)
+
+    def _qp_matrices(
+        self, solver_key: tuple, pos_coeff: np.ndarray, vel_coeff: np.ndarray
+    ) -> tuple[sp.csc_matrix, sp.csc_matrix]:
+        """Return the fixed ``(P, A)`` pair, cached per ``solver_key``.
+
+        Only q, l and u depend on the state and IR, so for a fixed horizon and
+        configuration the sparse matrices are assembled once.
+        """
+
+        cached = self._matrix_cache.get(solver_key)
+        if cached is not None:
+            return cached
+
+        H, _, mass, position_weight, velocity_weight, control_weight, slack_weight = solver_key
+        z_dim = 2 * H
+
+        P_controls = 2.0 * (
+            position_weight * pos_coeff.T @ pos_coeff
+            + velocity_weight * vel_coeff.T @ vel_coeff
+            + control_weight * np.eye(H)
+        )
+
+        # Slack penalty (diagonal block for slack variables)
+        slack_diag = sp.identity(H, format="csc") * (2.0 * slack_weight)
+        P_mat = sp.block_diag((P_controls, slack_diag), format="csc")
+
+        # Constraint rows, in order:
+        #   [0, 2H)   force: +/- mass * a - slack <= max_force (interleaved)
+        #   [2H, 3H)  slack >= 0
+        #   [3H, 4H)  velocity limits on predicted states
+        #   [4H, 5H)  acceleration limits
+        steps = np.arange(H)
+        tril_rows, tril_cols = np.tril_indices(H)
+        rows = np.concatenate((
+            np.repeat(2 * steps, 2),
+            np.repeat(2 * steps + 1, 2),
+            2 * H + steps,
+            3 * H + tril_rows,
+            4 * H + steps,
+        ))
+        cols = np.concatenate((
+            np.column_stack((steps, H + steps)).ravel(),
+            np.column_stack((steps, H + steps)).ravel(),
+            H + steps,
+            tril_cols,
+            steps,
+        ))
+        data = np.concatenate((
+            np.tile([mass, -1.0], H),
+            np.tile([-mass, -1.0], H),
+            np.ones(H),
+            vel_coeff[tril_rows, tril_cols],
+            np.ones(H),
+        ))
+        A_con = sp.csc_matrix((data, (rows, cols)), shape=(5 * H, z_dim))
+
+        cached = (P_mat, A_con)
+        self._matrix_cache[solver_key] = cached
+        return cached
+
+    def _prediction_matrices(self, dt: float, horizon: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return ``(elapsed, pos_coeff, vel_coeff)``, cached per ``(dt, horizon)``.
+
+        ``elapsed[k] = (k + 1) * dt`` is the free-response time offset of step k.
+        """
+
+        key = (dt, horizon)
+        cached = self._prediction_cache.get(key)
+        if cached is not None:
+            return cached
+
+        # For the double integrator A^m B = [(m + 0.5) * dt^2, dt], so column j of
+        # the prediction matrices holds A^(k-j) B and both are lower-triangular
+        # Toeplitz matrices built from that closed form.
+        steps = np.arange(horizon)
+        elapsed = (steps + 1) * dt
+        pos_series = (steps + 0.5) * dt * dt
+        vel_series = np.full(horizon, dt)
+        zeros = np.zeros(horizon - 1)
+        pos_coeff = toeplitz(pos_series, np.r_[pos_series[0], zeros])
+        vel_coeff = toeplitz(vel_series, np.r_[vel_series[0], zeros])
+
+        cached = (elapsed, pos_coeff, vel_coeff)
+        self._prediction_cache[key] = cached
+        return cached
+
     def compute_control(self, ir: MechanicsIR, state: PegInHoleState) -> float:
         plan = self.plan(ir, state)
         return plan.first_control()
+
+
+class BlockMPCSolver:
+    """Solve independent single-axis MPC problems as one block-diagonal OSQP QP.
+
+    The stacked solver is set up on the first call and afterwards only has its
+    q, l and u vectors updated, as long as the controllers' fixed QP structure
+    is unchanged. OSQP reports one status for the whole stack, so when it fails
+    every item is re-planned by its own controller and only the items that
+    really fail get that controller's fallback plan.
+    """
+
+    def __init__(self) -> None:
+        self._solver: osqp.OSQP | None = None
+        self._solver_key: tuple | None = None
+
+    def plan(
+        self,
+        controllers: Sequence[PegInHoleMPC],
+        irs: Sequence[MechanicsIR],
+        states: Sequence[PegInHoleState],
+    ) -> List[MPCPlan]:
+        problems = [controller._build_qp(ir, state) for controller, ir, state in zip(controllers, irs, states)]
+        q = np.concatenate([qp.q for qp in problems])
+        l = np.concatenate([qp.l for qp in problems])
+        u = np.concatenate([qp.u for qp in problems])
+        solver_key = tuple(qp.solver_key for qp in problems)
+        if self._solver is None or self._solver_key != solver_key:
+            self._solver = osqp.OSQP()
+            self._solver.setup(
+                P=sp.block_diag([qp.P for qp in problems], format="csc"),
+                q=q,
+                A=sp.block_diag([qp.A for qp in problems], format="csc"),
+                l=l,
+                u=u,
+                verbose=False,
+                warm_starting=True,
+            )
+            self._solver_key = solver_key
+        else:
+            self._solver.update(q=q, l=l, u=u)
+        result = self._solver.solve()
+
+        if getattr(result.info, "status", "") not in _SOLVED_STATUSES:
+            return [controller.plan(ir, state) for controller, ir, state in zip(controllers, irs, states)]
+
+        plans = []
+        offset = 0
+        for controller, qp in zip(controllers, problems):
+            z = result.x[offset : offset + qp.q.size]
+            offset += qp.q.size
+            cost = 0.5 * float(z @ (qp.P @ z)) + float(qp.q @ z)
+            plans.append(controller._make_plan(qp, z, cost))
+        return plans
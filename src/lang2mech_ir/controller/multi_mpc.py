@@ -3,27 +3,35 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import List
+from typing import List, Sequence
+
+import numpy as np
 
 from ..ir_schema import MechanicsIR
 from .state import JointSpaceState, MultiJointMPCPlan, ControllerConfig, PegInHoleState
-from .mpc import PegInHoleMPC
+from .mpc import BlockMPCSolver, PegInHoleMPC
+
+
+def _empty() -> np.ndarray:
+    return np.empty(0, dtype=np.float64)
 
 
 @dataclass
 class MultiJointMPCConfig:
+    """Per-joint MPC parameters; list inputs are broadcast to float arrays."""
+
     joint_count: int
     horizon: int = 10
     timestep_s: float = 0.02
-    masses: List[float] = field(default_factory=list)
-    max_forces: List[float] = field(default_factory=list)
-    speed_targets: List[float] = field(default_factory=list)
-    velocity_limits: List[float] = field(default_factory=list)
-    acceleration_limits: List[float] = field(default_factory=list)
-    position_weights: List[float] = field(default_factory=list)
-    velocity_weights: List[float] = field(default_factory=list)
-    control_weights: List[float] = field(default_factory=list)
-    slack_weights: List[float] = field(default_factory=list)
+    masses: np.ndarray = field(default_factory=_empty)
+    max_forces: np.ndarray = field(default_factory=_empty)
+    speed_targets: np.ndarray = field(default_factory=_empty)
+    velocity_limits: np.ndarray = field(default_factory=_empty)
+    acceleration_limits: np.ndarray = field(default_factory=_empty)
+    position_weights: np.ndarray = field(default_factory=_empty)
+    velocity_weights: np.ndarray = field(default_factory=_empty)
+    control_weights: np.ndarray = field(default_factory=_empty)
+    slack_weights: np.ndarray = field(default_factory=_empty)
 
     def __post_init__(self) -> None:
         self.masses = self._broadcast(self.masses, 2.0)
@@ -36,35 +44,53 @@ class MultiJointMPCConfig:
         self.control_weights = self._broadcast(self.control_weights, 0.1)
         self.slack_weights = self._broadcast(self.slack_weights, 100.0)
 
-    def _broadcast(self, values: List[float], default: float) -> List[float]:
-        if not values:
-            return [default] * self.joint_count
-        if len(values) != self.joint_count:
+    def _broadcast(self, values: Sequence[float] | np.ndarray, default: float) -> np.ndarray:
+        arr = np.asarray(values, dtype=np.float64)
+        if arr.size == 0:
+            return np.full(self.joint_count, default, dtype=np.float64)
+        if arr.size != self.joint_count:
             raise ValueError("Config list length must match joint_count")
-        return values
+        return arr.reshape(self.joint_count)
 
 
 class MultiJointMPC:
-    """Solve decoupled MPC problems for each joint."""
+    """Solve the decoupled per-joint MPC problems as one block-diagonal QP."""
 
     def __init__(self, config: MultiJointMPCConfig) -> None:
         self.config = config
+        # Per-joint controllers are static for a given config; they build each
+        # joint's QP, and the stacked solver is set up once and then updated.
+        self._controllers = [
+            PegInHoleMPC(self._single_controller_config(idx)) for idx in range(config.joint_count)
+        ]
+        # Only the goal depth changes between ticks, so each joint's IR is
+        # built once and updated in place.
+        self._irs = [self._single_ir(idx, 0.0) for idx in range(config.joint_count)]
+        self._solver = BlockMPCSolver()
 
     def plan(self, state: JointSpaceState) -> MultiJointMPCPlan:
-        controls: List[List[float]] = []
-        costs: List[float | None] = []
-        for idx in range(self.config.joint_count):
-            controller = PegInHoleMPC(self._single_controller_config(idx))
-            ir = self._single_ir(idx, state.goal_positions[idx])
-            joint_state = PegInHoleState(
-                position_m=state.joint_positions[idx],
-                velocity_mps=state.joint_velocities[idx],
-                depth_goal_m=state.goal_positions[idx],
-                timestamp_s=state.timestamp_s,
+        # Every joint shares the horizon and constraint topology, so the
+        # per-joint QPs are stacked into one block-diagonal problem.
+        joint_states = []
+        for idx, ir in enumerate(self._irs):
+            ir.hole.depth_m = state.goal_positions[idx]
+            joint_states.append(
+                PegInHoleState(
+                    position_m=state.joint_positions[idx],
+                    velocity_mps=state.joint_velocities[idx],
+                    depth_goal_m=state.goal_positions[idx],
+                    timestamp_s=state.timestamp_s,
+                )
             )
-            plan = controller.plan(ir, joint_state)
-            controls.append(plan.control_sequence)
-            costs.append(plan.cost)
+        plans = self._solver.plan(self._controllers, self._irs, joint_states)
+
+        # Joints whose QP failed keep zero controls and a None cost.
+        controls = np.zeros((self.config.joint_count, self.config.horizon))
+        costs: List[float | None] = [None] * self.config.joint_count
+        for idx, plan in enumerate(plans):
+            if plan.cost is not None:
+                controls[idx] = plan.control_sequence
+                costs[idx] = plan.cost
         return MultiJointMPCPlan(control_sequences=controls, costs=costs)
 
     def _single_controller_config(self, idx: int) -> ControllerConfig:
@@ -5,8 +5,10 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import List
 
+import numpy as np
 
-@dataclass
+
+@dataclass(slots=True)
 class PegInHoleState:
     """Simplified peg-in-hole state in the insertion axis."""
 
@@ -16,7 +18,7 @@ class PegInHoleState:
     timestamp_s: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class ControllerConfig:
     """Tunable MPC parameters."""
 
@@ -34,7 +36,7 @@ class ControllerConfig:
     contact_start_depth_m: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class MPCPlan:
     """Result of one MPC optimization."""
 
@@ -47,7 +49,7 @@ class MPCPlan:
         return self.control_sequence[0] if self.control_sequence else 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class JointSpaceState:
     """Joint-space state for multi-DoF controllers."""
 
@@ -57,12 +59,15 @@ class JointSpaceState:
     timestamp_s: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class MultiJointMPCPlan:
     """Plan for multiple joints (contains per-joint control sequences)."""
 
-    control_sequences: List[List[float]] = field(default_factory=list)
+    control_sequences: np.ndarray = field(default_factory=lambda: np.empty((0, 0)))  # (joints, horizon)
     costs: List[float | None] = field(default_factory=list)
 
     def first_controls(self) -> List[float]:
-        return [seq[0] if seq else 0.0 for seq in self.control_sequences]
+        joints, horizon = self.control_sequences.shape
+        if horizon == 0:
+            return [0.0] * joints
+        return self.control_sequences[:, 0].tolist()
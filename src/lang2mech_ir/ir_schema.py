@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
-from dataclasses import asdict, dataclass, field
+from dataclasses import asdict, dataclass, field, fields, is_dataclass, replace
 from typing import Any, Dict, List, Optional
 import copy
+import math
 
 
-@dataclass
+@dataclass(slots=True)
 class ConstraintBounds:
     """Describes scalar bounds for a constraint quantity (e.g., force)."""
 
@@ -18,28 +19,27 @@ class ConstraintBounds:
     def clamp(self, value: float) -> float:
         """Clamp *value* within the bounds if they exist."""
 
-        if self.minimum is not None and value < self.minimum:
-            value = self.minimum
-        if self.maximum is not None and value > self.maximum:
-            value = self.maximum
-        return value
+        # Bounds are resolved per call because the auditor/parser mutate them.
+        lower = -math.inf if self.minimum is None else self.minimum
+        upper = math.inf if self.maximum is None else self.maximum
+        return min(max(value, lower), upper)
 
 
-@dataclass
+@dataclass(slots=True)
 class PegGeometry:
     radius_m: float = 0.005  # 5 mm
     length_m: float = 0.10
     chamfer_angle_deg: float = 3.0
 
 
-@dataclass
+@dataclass(slots=True)
 class HoleGeometry:
     radius_m: float = 0.0055  # default 0.5 mm clearance
     depth_m: float = 0.05
     chamfer_angle_deg: float = 3.0
 
 
-@dataclass
+@dataclass(slots=True)
 class MaterialProperties:
     friction_coefficient: float = 0.3
     peg_material: str = "generic"
@@ -47,7 +47,7 @@ class MaterialProperties:
     lubrication: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class TrajectoryProfile:
     approach_speed_mps: float = 0.02
     insertion_speed_mps: float = 0.01
@@ -56,20 +56,20 @@ class TrajectoryProfile:
     strategy: str = "straight_in"
 
 
-@dataclass
+@dataclass(slots=True)
 class ToleranceSpecification:
     alignment_deg: float = 2.0
     position_m: float = 0.0005
     clearance_m: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class EnvironmentSettings:
     gravity_mps2: float = 9.81
     temperature_c: float = 22.0
 
 
-@dataclass
+@dataclass(slots=True)
 class MechanicsIR:
     """Structured representation of peg-in-hole instructions."""
 
@@ -92,43 +92,62 @@ class MechanicsIR:
         return asdict(self)
 
     def copy(self) -> "MechanicsIR":
-        """Return a deep copy of the IR."""
-
-        return copy.deepcopy(self)
+        """Return a deep copy of the IR.
+
+        Section dataclasses only hold immutable scalars, so they are cloned
+        field-wise; only user-supplied ``metadata`` goes through ``deepcopy``.
+        """
+
+        return MechanicsIR(
+            task_name=self.task_name,
+            action_type=self.action_type,
+            peg=replace(self.peg),
+            hole=replace(self.hole),
+            materials=replace(self.materials),
+            tolerances=replace(self.tolerances),
+            trajectory=replace(self.trajectory),
+            max_force=replace(self.max_force),
+            time_limit_s=self.time_limit_s,
+            environment=replace(self.environment),
+            metadata=copy.deepcopy(self.metadata) if self.metadata else {},
+            notes=list(self.notes),
+        )
 
     @classmethod
     def from_dict(cls, payload: Dict[str, Any]) -> "MechanicsIR":
-        """Construct an IR from a dictionary (inverse of :meth:`to_dict`)."""
-
-        default = cls()
-        default_dict = default.to_dict()
-        merged = _deep_merge(default_dict, payload)
-        return cls(**{
-            "task_name": merged["task_name"],
-            "action_type": merged["action_type"],
-            "peg": PegGeometry(**merged["peg"]),
-            "hole": HoleGeometry(**merged["hole"]),
-            "materials": MaterialProperties(**merged["materials"]),
-            "tolerances": ToleranceSpecification(**merged["tolerances"]),
-            "trajectory": TrajectoryProfile(**merged["trajectory"]),
-            "max_force": ConstraintBounds(**merged["max_force"]),
-            "time_limit_s": merged.get("time_limit_s"),
-            "environment": EnvironmentSettings(**merged["environment"]),
-            "metadata": merged.get("metadata", {}),
-            "notes": merged.get("notes", []),
-        })
+        """Construct an IR from a dictionary (inverse of :meth:`to_dict`).
+
+        Missing keys keep their defaults; section dictionaries are merged
+        field-wise into the default section rather than replacing it.
+        """
+
+        ir = cls()
+        for f in fields(cls):
+            if f.name not in payload:
+                continue
+            value = payload[f.name]
+            current = getattr(ir, f.name)
+            if isinstance(value, dict):
+                if is_dataclass(current):
+                    value = replace(current, **value)
+                elif isinstance(current, dict):
+                    value = _deep_merge(current, value)
+            setattr(ir, f.name, value)
+        return ir
 
 
 def _deep_merge(base: Dict[str, Any], overrides: Dict[str, Any]) -> Dict[str, Any]:
-    """Deep merge helper for :meth:`MechanicsIR.from_dict`."""
+    """Deep merge helper for dictionary fields in :meth:`MechanicsIR.from_dict`.
+
+    Neither input is mutated; nested values not touched by *overrides* are
+    shared with *base* rather than copied.
+    """
 
-    result: Dict[str, Any] = copy.deepcopy(base)
+    result: Dict[str, Any] = dict(base)
     for key, value in overrides.items():
-        if key not in result:
-            result[key] = value
-            continue
-        if isinstance(value, dict) and isinstance(result[key], dict):
-            result[key] = _deep_merge(result[key], value)
+        current = result.get(key)
+        if isinstance(value, dict) and isinstance(current, dict):
+            result[key] = _deep_merge(current, value)
         else:
             result[key] = value
     return result
@@ -6,7 +6,9 @@ import json
 import logging
 import os
 import re
-from typing import Any, Dict, Iterable, List, Tuple
+import sys
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple
 
 from .ir_schema import MechanicsIR
 from .parser import InstructionParser
@@ -15,21 +17,107 @@ from .parser import InstructionParser
 logger = logging.getLogger(__name__)
 
 
+def _build_unit_table() -> Dict[str, str]:
+    """Map every accepted (lowercased) unit spelling to its canonical unit."""
+
+    lengths = {
+        "m": ("m", "meter", "meters"),
+        "mm": ("mm", "millimeter", "millimeters"),
+        "cm": ("cm", "centimeter", "centimeters"),
+        "um": ("um",),
+    }
+    simple = {
+        **lengths,
+        "s": ("s", "second", "seconds"),
+        "ms": ("ms",),
+        "min": ("min", "minute", "minutes"),
+        "hr": ("hr", "hour", "hours"),
+        "deg": ("deg", "degree", "degrees"),
+        "N": ("n", "newton", "newtons"),
+        "kN": ("kn",),
+        "m/s^2": ("g",),
+    }
+    table = {spelling: canonical for canonical, spellings in simple.items() for spelling in spellings}
+    for separator in ("/", "per"):
+        for second in simple["s"]:
+            for length in ("m", "mm", "cm"):
+                for spelling in lengths[length]:
+                    table[f"{spelling}{separator}{second}"] = f"{length}/s"
+            for spelling in lengths["m"]:
+                table[f"{spelling}{separator}{second}^2"] = "m/s^2"
+    return table
+
+
+def _any_of(*words: str) -> re.Pattern[str]:
+    """Compile a substring alternation equivalent to ``any(w in text for w in words)``."""
+
+    return re.compile("|".join(re.escape(word) for word in words))
+
+
+def _keyword_scanner(groups: Dict[str, frozenset[str]]) -> Tuple[re.Pattern[str], Dict[str, str]]:
+    """Compile one overlapping substring scan over every word in *groups*.
+
+    Returns the pattern and a word -> category table; each match's group 1 is
+    a word found anywhere in the text, so one ``finditer`` pass yields the set
+    of categories present.
+    """
+
+    category = {word: name for name, words in groups.items() for word in words}
+    words = sorted(category, key=len, reverse=True)
+    pattern = re.compile("(?=(" + "|".join(re.escape(word) for word in words) + "))")
+    return pattern, category
+
+
 class LLMInterface:
     """Translate instructions into Mechanics IR using heuristics or Claude API."""
 
-    _MEASURE_PATTERN = re.compile(r"(?P<value>\d+(?:\.\d+)?)\s*(?P<unit>[A-Za-z0-9°/\^]+)", re.IGNORECASE)
-
-    _PEG_WORDS = ("peg", "pin", "shaft", "rod")
-    _HOLE_WORDS = ("hole", "socket", "bushing", "slot")
-    _CLEARANCE_WORDS = ("clearance", "gap", "play")
-    _FORCE_WORDS = ("force", "load", "push", "pressure")
-    _SPEED_WORDS = ("speed", "velocity", "feed", "rate", "insert", "drive")
-    _TOLERANCE_WORDS = ("tolerance", "align", "alignment", "accuracy", "precision")
-    _DEPTH_WORDS = ("depth", "deep")
-    _LENGTH_WORDS = ("length", "long", "lengthwise")
-    _RETRACT_WORDS = ("retract", "withdraw", "pull")
-    _APPROACH_WORDS = ("approach", "advance")
+    # Applied to the lowercased instruction so spans index ``lower_text`` directly.
+    _MEASURE_PATTERN = re.compile(r"(?P<value>\d+(?:\.\d+)?)\s*(?P<unit>[a-z0-9°/\^]+)")
+
+    _PEG_WORDS = _any_of("peg", "pin", "shaft", "rod")
+    _HOLE_WORDS = _any_of("hole", "socket", "bushing", "slot")
+    _CLEARANCE_WORDS = _any_of("clearance", "gap", "play")
+    _FORCE_WORDS = _any_of("force", "load", "push", "pressure")
+    _SPEED_WORDS = _any_of("speed", "velocity", "feed", "rate", "insert", "drive")
+    _TOLERANCE_WORDS = _any_of("tolerance", "align", "alignment", "accuracy", "precision")
+    _DEPTH_WORDS = _any_of("depth", "deep")
+    _LENGTH_WORDS = _any_of("length", "long", "lengthwise")
+    _RETRACT_WORDS = _any_of("retract", "withdraw", "pull")
+    _APPROACH_WORDS = _any_of("approach", "advance")
+    _POSITION_WORDS = _any_of("position", "offset")
+
+    # Whole-instruction cues, found with one scan in ``_apply_keyword_heuristics``.
+    _HEURISTIC_WORDS: Dict[str, frozenset[str]] = {
+        "slow": frozenset({"slow", "slowly", "gentle", "gently"}),
+        "fast": frozenset({"fast", "quick", "rapid"}),
+        "spiral": frozenset({"spiral"}),
+        "straight": frozenset({"straight"}),
+        "careful": frozenset({"careful", "carefully", "precise", "precision", "accurate"}),
+        "tight_fit": frozenset({"tight fit", "press-fit", "press fit"}),
+        "loose": frozenset({"loose"}),
+        "lubricated": frozenset({"lubricated", "lubrication", "oiled"}),
+        "dry": frozenset({"dry"}),
+    }
+    _HEURISTIC_SCAN, _HEURISTIC_CATEGORY = _keyword_scanner(_HEURISTIC_WORDS)
+
+    _UNIT_CANON = _build_unit_table()
+    # Dotted slot -> (section key, field); any other slot is a top-level key.
+    _SLOT_MAP: Dict[str, Tuple[str, str]] = {
+        "peg.length": ("peg_dimensions", "length"),
+        "peg.radius": ("peg_dimensions", "radius"),
+        "peg.diameter": ("peg_dimensions", "diameter"),
+        "hole.depth": ("hole_dimensions", "depth"),
+        "hole.radius": ("hole_dimensions", "radius"),
+        "hole.diameter": ("hole_dimensions", "diameter"),
+        "trajectory.insertion_speed": ("trajectory", "insertion_speed"),
+        "trajectory.approach_speed": ("trajectory", "approach_speed"),
+        "trajectory.retraction_speed": ("trajectory", "retraction_speed"),
+        "trajectory.approach_angle": ("trajectory", "approach_angle"),
+        "trajectory.strategy": ("trajectory", "strategy"),
+        "max_force.maximum": ("max_force", "maximum"),
+        "materials.lubrication": ("material_properties", "lubrication"),
+        "environment.gravity": ("environment", "gravity"),
+    }
 
     _REMOTE_SYSTEM_PROMPT = (
         "You are an interface for a peg-in-hole robotics controller. "
@@ -73,6 +161,9 @@ class LLMInterface:
         self.temperature = temperature
         self.max_tokens = max_tokens
         self._client = None
+        # Heuristic compilation is deterministic per instruction, so its IRs are
+        # memoized; callers always receive a copy they are free to mutate.
+        self._compile_local = lru_cache(maxsize=1024)(self._compile_uncached)
 
     # ------------------------------------------------------------------ public API
     def interpret(self, instruction: str) -> Dict[str, Any]:
@@ -99,7 +190,7 @@ class LLMInterface:
         }
         lower_text = instruction.lower()
         self._apply_keyword_heuristics(lower_text, structured)
-        for measurement in self._extract_measurements(instruction):
+        for measurement in self._extract_measurements(lower_text):
             self._assign_measurement(lower_text, structured, measurement)
         self._cleanup(structured)
         return structured
@@ -186,39 +277,44 @@ class LLMInterface:
     def compile(self, instruction: str) -> MechanicsIR:
         """Return a finalized :class:`MechanicsIR` from *instruction*."""
 
+        if self.use_remote:
+            return self._compile_uncached(instruction)
+        return self._compile_local(instruction).copy()
+
+    def _compile_uncached(self, instruction: str) -> MechanicsIR:
         structured = self.interpret(instruction)
         return self.parser.parse(structured)
 
     # ------------------------------------------------------------------ heuristics
     def _apply_keyword_heuristics(self, lower_text: str, data: Dict[str, Any]) -> None:
-        def contains(words: Iterable[str]) -> bool:
-            return any(word in lower_text for word in words)
+        category = self._HEURISTIC_CATEGORY
+        found = {category[match.group(1)] for match in self._HEURISTIC_SCAN.finditer(lower_text)}
 
-        if contains(("slow", "slowly", "gentle", "gently")):
+        if "slow" in found:
             self._assign_once(data, "trajectory.insertion_speed", "0.002 m/s")
             self._assign_once(data, "max_force.maximum", "5 N")
-        if contains(("fast", "quick", "rapid")):
+        if "fast" in found:
             self._assign_once(data, "trajectory.insertion_speed", "0.05 m/s")
-        if "spiral" in lower_text:
+        if "spiral" in found:
             self._assign_once(data, "trajectory.strategy", "spiral_search")
-        elif "straight" in lower_text:
+        elif "straight" in found:
             self._assign_once(data, "trajectory.strategy", "straight_in")
-        if contains(("careful", "carefully", "precise", "precision", "accurate")):
+        if "careful" in found:
             self._assign_once(data, "alignment_tolerance", "1 deg")
             self._assign_once(data, "position_tolerance", "0.0003 m")
-        if contains(("tight fit", "press-fit", "press fit")):
+        if "tight_fit" in found:
             self._assign_once(data, "clearance", "0.0001 m")
-        elif "loose" in lower_text:
+        elif "loose" in found:
             self._assign_once(data, "clearance", "0.0005 m")
-        if contains(("lubricated", "lubrication", "oiled")):
+        if "lubricated" in found:
             self._assign_once(data, "materials.lubrication", True)
-        if contains(("dry",)):
+        if "dry" in found:
             self._assign_once(data, "materials.lubrication", False)
 
     # ------------------------------------------------------------------ measurement extraction
-    def _extract_measurements(self, instruction: str) -> List[Tuple[str, str, Tuple[int, int]]]:
+    def _extract_measurements(self, lower_text: str) -> List[Tuple[str, str, Tuple[int, int]]]:
         matches: List[Tuple[str, str, Tuple[int, int]]] = []
-        for match in self._MEASURE_PATTERN.finditer(instruction):
+        for match in self._MEASURE_PATTERN.finditer(lower_text):
             value = match.group("value")
             unit = match.group("unit")
             canonical_unit = self._canonical_unit(unit)
@@ -236,15 +332,17 @@ class LLMInterface:
     ) -> None:
         value_with_unit, canonical_unit, span = measurement
         pre_context = lower_text[max(0, span[0] - 40) : span[0]]
-        post_context = lower_text[span[1] : min(len(lower_text), span[1] + 40)]
+        post_context = lower_text[span[1] : span[1] + 40]
         context = pre_context + post_context
-        near_pre = lower_text[max(0, span[0] - 16) : span[0]]
-        near_post = lower_text[span[1] : min(len(lower_text), span[1] + 16)]
-        near_context = near_pre + near_post
-        length_marker = self._contains_any(near_context, self._LENGTH_WORDS)
-        depth_marker = self._contains_any(near_context, self._DEPTH_WORDS)
-        peg_score = self._context_score(context, near_context, self._PEG_WORDS)
-        hole_score = self._context_score(context, near_context, self._HOLE_WORDS)
+        # The 16-character window either side of the measurement is a
+        # contiguous slice of ``context``; scan it by offset instead of copying.
+        split = len(pre_context)
+        near_start = max(0, split - 16)
+        near_end = split + min(16, len(post_context))
+        length_marker = self._contains_any(context, self._LENGTH_WORDS, near_start, near_end)
+        depth_marker = self._contains_any(context, self._DEPTH_WORDS, near_start, near_end)
+        peg_score = self._context_score(context, near_start, near_end, self._PEG_WORDS)
+        hole_score = self._context_score(context, near_start, near_end, self._HOLE_WORDS)
 
         if canonical_unit in {"mm", "cm", "m", "um"}:
             if depth_marker and hole_score > 0:
@@ -253,7 +351,7 @@ class LLMInterface:
             if self._contains_any(context, self._CLEARANCE_WORDS):
                 self._assign_once(data, "clearance", value_with_unit)
                 return
-            if self._contains_any(context, ("position", "offset")) or self._contains_any(context, self._TOLERANCE_WORDS):
+            if self._contains_any(context, self._POSITION_WORDS) or self._contains_any(context, self._TOLERANCE_WORDS):
                 self._assign_once(data, "position_tolerance", value_with_unit)
                 return
             if peg_score > hole_score and length_marker:
@@ -272,9 +370,9 @@ class LLMInterface:
                     self._assign_once(data, "hole.diameter", value_with_unit)
                 return
         elif canonical_unit in {"mm/s", "cm/s", "m/s"}:
-            if self._contains_any(near_pre, self._APPROACH_WORDS):
+            if self._contains_any(context, self._APPROACH_WORDS, near_start, split):
                 self._assign_once(data, "trajectory.approach_speed", value_with_unit)
-            elif self._contains_any(near_pre, self._RETRACT_WORDS):
+            elif self._contains_any(context, self._RETRACT_WORDS, near_start, split):
                 self._assign_once(data, "trajectory.retraction_speed", value_with_unit)
             else:
                 self._assign_once(data, "trajectory.insertion_speed", value_with_unit)
@@ -304,50 +402,14 @@ class LLMInterface:
 
     # ------------------------------------------------------------------ utilities
     def _assign_once(self, data: Dict[str, Any], slot: str, value: Any) -> bool:
-        if slot.startswith("peg."):
-            field = slot.split(".", 1)[1]
-            bucket = data.setdefault("peg_dimensions", {})
-            if field not in bucket:
-                bucket[field] = value
-                return True
-            return False
-        if slot.startswith("hole."):
-            field = slot.split(".", 1)[1]
-            bucket = data.setdefault("hole_dimensions", {})
-            if field not in bucket:
-                bucket[field] = value
-                return True
-            return False
-        if slot.startswith("trajectory."):
-            field = slot.split(".", 1)[1]
-            bucket = data.setdefault("trajectory", {})
-            if field not in bucket:
-                bucket[field] = value
-                return True
-            return False
-        if slot.startswith("max_force."):
-            field = slot.split(".", 1)[1]
-            bucket = data.setdefault("max_force", {})
-            if field not in bucket:
-                bucket[field] = value
-                return True
-            return False
-        if slot.startswith("materials."):
-            field = slot.split(".", 1)[1]
-            bucket = data.setdefault("material_properties", {})
-            if field not in bucket:
-                bucket[field] = value
-                return True
-            return False
-        if slot.startswith("environment."):
-            field = slot.split(".", 1)[1]
-            bucket = data.setdefault("environment", {})
-            if field not in bucket:
-                bucket[field] = value
-                return True
-            return False
-        if slot not in data:
-            data[slot] = value
+        target = self._SLOT_MAP.get(slot)
+        if target is None:
+            bucket, field = data, slot
+        else:
+            bucket = data.setdefault(target[0], {})
+            field = target[1]
+        if field not in bucket:
+            bucket[field] = value
             return True
         return False
 
@@ -356,34 +418,21 @@ class LLMInterface:
             if key in data and not data[key]:
                 del data[key]
 
-    def _contains_any(self, text: str, patterns: Iterable[str]) -> bool:
-        return any(pattern in text for pattern in patterns)
-
-    def _context_score(self, context: str, near_context: str, patterns: Iterable[str]) -> int:
-        score = 0
-        if self._contains_any(context, patterns):
-            score += 1
-        if self._contains_any(near_context, patterns):
-            score += 2
-        return score
+    def _contains_any(
+        self,
+        text: str,
+        patterns: re.Pattern[str],
+        start: int = 0,
+        end: int = sys.maxsize,
+    ) -> bool:
+        return patterns.search(text, start, end) is not None
+
+    def _context_score(self, context: str, near_start: int, near_end: int, patterns: re.Pattern[str]) -> int:
+        # A hit in the near window is also a hit in the full context (1 + 2).
+        if self._contains_any(context, patterns, near_start, near_end):
+            return 3
+        return 1 if self._contains_any(context, patterns) else 0
 
     def _canonical_unit(self, unit: str) -> str | None:
-        token = unit.strip().lower().replace("°", "deg")
-        token = token.replace("per", "/").replace(" ", "")
-        token = token.replace("seconds", "s").replace("second", "s")
-        token = token.replace("millimeters", "mm").replace("millimeter", "mm")
-        token = token.replace("centimeters", "cm").replace("centimeter", "cm")
-        token = token.replace("meters", "m").replace("meter", "m")
-        token = token.replace("newtons", "n").replace("newton", "n")
-        token = token.replace("degrees", "deg").replace("degree", "deg")
-        token = token.replace("minutes", "min").replace("minute", "min")
-        token = token.replace("hours", "hr").replace("hour", "hr")
-        if token in {"mm", "cm", "m", "um", "mm/s", "cm/s", "m/s", "deg", "s", "ms", "min", "hr", "m/s^2"}:
-            return token
-        if token == "n":
-            return "N"
-        if token == "kn":
-            return "kN"
-        if token == "g":
-            return "m/s^2"
-        return None
+        token = unit.strip().lower().replace("°", "deg").replace(" ", "")
+        return self._UNIT_CANON.get(token)
@@ -5,6 +5,8 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import Dict
 
+import numpy as np
+
 from ..ir_schema import MechanicsIR
 from ..simulation.environment import EpisodeLog
 
@@ -32,7 +34,7 @@ class EpisodeMetrics:
 
 
 def compute_metrics(ir: MechanicsIR, log: EpisodeLog, depth_tolerance: float = 1e-3) -> EpisodeMetrics:
-    if not log.times_s:
+    if len(log.times_s) == 0:
         return EpisodeMetrics(
             success=False,
             final_depth_m=0.0,
@@ -43,13 +45,14 @@ def compute_metrics(ir: MechanicsIR, log: EpisodeLog, depth_tolerance: float = 1
             duration_s=0.0,
         )
 
-    final_depth = log.positions_m[-1]
-    final_force = log.contact_forces_N[-1]
-    max_force_observed = max(log.contact_forces_N) if log.contact_forces_N else 0.0
+    forces = np.asarray(log.contact_forces_N, dtype=float)
+    final_depth = float(log.positions_m[-1])
+    final_force = float(forces[-1]) if forces.size else 0.0
+    max_force_observed = float(forces.max()) if forces.size else 0.0
     goal = ir.hole.depth_m
-    duration = log.times_s[-1]
-    success = (final_depth >= goal - depth_tolerance) and (max_force_observed <= ir.max_force.maximum + 1e-6)
-    force_violation = max_force_observed > ir.max_force.maximum + 1e-6
+    duration = float(log.times_s[-1])
+    force_violation = bool((forces > ir.max_force.maximum + 1e-6).any())
+    success = (final_depth >= goal - depth_tolerance) and not force_violation
     return EpisodeMetrics(
         success=success,
         final_depth_m=final_depth,
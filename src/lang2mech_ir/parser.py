@@ -24,22 +24,15 @@ class InstructionParser:
         ir = self.base_ir.copy()
         notes: list[str] = []
 
-        self._apply_task_fields(instruction, ir)
-        self._apply_peg_fields(instruction, ir, notes)
-        self._apply_hole_fields(instruction, ir, notes)
-        self._apply_material_fields(instruction, ir)
-        self._apply_trajectory_fields(instruction, ir, notes)
-        self._apply_tolerance_fields(instruction, ir, notes)
-        self._apply_force_fields(instruction, ir, notes)
-        self._apply_time_limit(instruction, ir, notes)
-        self._apply_environment_fields(instruction, ir, notes)
+        for name in self._SECTIONS:
+            getattr(self, name)(instruction, ir, notes)
 
         if notes:
             ir.notes.extend(notes)
         return ir
 
     # ------------------------------------------------------------------ helpers
-    def _apply_task_fields(self, payload: Mapping[str, Any], ir: MechanicsIR) -> None:
+    def _apply_task_fields(self, payload: Mapping[str, Any], ir: MechanicsIR, notes: list[str]) -> None:
         action_type = self._first_value(payload, ("action_type", "action", "task"))
         if action_type:
             ir.action_type = str(action_type)
@@ -93,7 +86,7 @@ class InstructionParser:
             chamfer = self._normalize(units.angle_to_deg, chamfer_value, "hole.chamfer_angle", notes)
             ir.hole.chamfer_angle_deg = chamfer.value
 
-    def _apply_material_fields(self, payload: Mapping[str, Any], ir: MechanicsIR) -> None:
+    def _apply_material_fields(self, payload: Mapping[str, Any], ir: MechanicsIR, notes: list[str]) -> None:
         section = self._mapping_for(payload, ("material_properties", "materials"))
         if section is None:
             return
@@ -201,6 +194,20 @@ class InstructionParser:
         if temperature is not None:
             ir.environment.temperature_c = float(temperature)
 
+    # Section applier names in application order; they are looked up on the
+    # instance so subclasses can override them.
+    _SECTIONS = (
+        "_apply_task_fields",
+        "_apply_peg_fields",
+        "_apply_hole_fields",
+        "_apply_material_fields",
+        "_apply_trajectory_fields",
+        "_apply_tolerance_fields",
+        "_apply_force_fields",
+        "_apply_time_limit",
+        "_apply_environment_fields",
+    )
+
     # ------------------------------------------------------------------ utilities
     @staticmethod
     def _note_if_assumed(notes: list[str], field: str, normalized: units.NormalizedValue) -> None:
@@ -233,6 +240,9 @@ class InstructionParser:
     def _mapping_for(payload: Mapping[str, Any], keys: Iterable[str]) -> Mapping[str, Any] | None:
         for key in keys:
             value = payload.get(key)
-            if isinstance(value, Mapping):
+            # Skip the (slow) ABC check for absent keys and plain dicts.
+            if value is None:
+                continue
+            if isinstance(value, dict) or isinstance(value, Mapping):
                 return value
         return None
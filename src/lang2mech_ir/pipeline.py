@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
-from typing import Iterable, List
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import astuple, dataclass, field, replace
+from typing import Iterable, List, Optional, Tuple
 
 from . import InstructionParser, MechanicsAuditor, LLMInterface
 from .controller import PegInHoleState, ControllerConfig
@@ -20,6 +22,17 @@ class PipelineResult:
     episode_log: EpisodeLog
     metrics: EpisodeMetrics
 
+    def copy(self) -> "PipelineResult":
+        """Return a copy that shares no mutable state with this result."""
+
+        return PipelineResult(
+            instruction=self.instruction,
+            ir=self.ir.copy(),
+            audit_notes=list(self.audit_notes),
+            episode_log=self.episode_log.copy(),
+            metrics=replace(self.metrics),
+        )
+
 
 @dataclass
 class LanguageToActionPipeline:
@@ -27,6 +40,7 @@ class LanguageToActionPipeline:
 
     controller_config: ControllerConfig = field(default_factory=ControllerConfig)
     use_remote_llm: bool = False
+    cache_size: int = 256
 
     def __post_init__(self) -> None:
         self.parser = InstructionParser()
@@ -34,10 +48,46 @@ class LanguageToActionPipeline:
         self.auditor = MechanicsAuditor()
         sim_config = SimulationConfig(controller=self.controller_config)
         self.simulator = SimpleInsertionSimulator(sim_config)
+        self._cache: OrderedDict[Tuple[str, tuple, tuple], PipelineResult] = OrderedDict()
+
+    def clear_cache(self) -> None:
+        """Forget memoized :meth:`process_instruction` results."""
+
+        self._cache.clear()
 
     def process_instruction(self, instruction: str) -> PipelineResult:
+        """Run the full pipeline for *instruction*.
+
+        With the local parser, results are memoized (LRU, ``cache_size``
+        entries) per instruction, simulation config and auditor thresholds;
+        every call returns its own copy, so callers may mutate the result.
+        Remote LLM results are never memoized. The key does not cover the
+        parser or LLM interface, so call :meth:`clear_cache` after changing them.
+        """
+
+        if self.use_remote_llm:
+            return self._process_uncached(instruction)
+        key = self._cache_key(instruction)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return cached.copy()
+        result = self._process_uncached(instruction)
+        self._remember(key, result)
+        return result.copy()
+
+    def _cache_key(self, instruction: str) -> Tuple[str, tuple, tuple]:
+        return instruction, astuple(self.simulator.config), tuple(vars(self.auditor).values())
+
+    def _remember(self, key: Tuple[str, tuple, tuple], result: PipelineResult) -> None:
+        self._cache[key] = result
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def _process_uncached(self, instruction: str) -> PipelineResult:
         ir = self.interface.compile(instruction)
-        audit = self.auditor.audit(ir)
+        # The compiled IR is freshly built for this call, so audit it in place.
+        audit = self.auditor.audit(ir, copy=False)
         initial_state = PegInHoleState(position_m=0.0, velocity_mps=0.0, depth_goal_m=ir.hole.depth_m)
         log = self.simulator.run_episode(audit.corrected_ir, initial_state)
         metrics = compute_metrics(audit.corrected_ir, log)
@@ -51,3 +101,70 @@ class LanguageToActionPipeline:
 
     def run_batch(self, instructions: Iterable[str]) -> List[PipelineResult]:
         return [self.process_instruction(text) for text in instructions]
+
+    def run_batch_parallel(self, instructions: Iterable[str], max_workers: Optional[int] = None) -> List[PipelineResult]:
+        """Like :meth:`run_batch`, but process uncached instructions in worker processes.
+
+        Each worker builds its own pipeline with this pipeline's configuration and
+        auditor; with the local parser, results are merged back into the memo cache.
+        """
+
+        texts = list(instructions)
+        if self.use_remote_llm:
+            pending = texts
+        else:
+            pending = list(dict.fromkeys(text for text in texts if self._cache_key(text) not in self._cache))
+        if not pending:
+            return [self.process_instruction(text) for text in texts]
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_worker,
+            initargs=(self.controller_config, self.use_remote_llm, self.simulator.config, self.auditor),
+        ) as executor:
+            results = list(executor.map(_process_in_worker, pending))
+        if self.use_remote_llm:
+            return results
+        fresh = dict(zip(pending, results))
+        for text, result in fresh.items():
+            self._remember(self._cache_key(text), result)
+        return [fresh[text].copy() if text in fresh else self.process_instruction(text) for text in texts]
+
+    def run_batch_vectorized(self, instructions: Iterable[str]) -> List[PipelineResult]:
+        """Like :meth:`run_batch`, but simulate all episodes in one lockstep batch."""
+
+        texts = list(instructions)
+        audits = [self.auditor.audit(self.interface.compile(text), copy=False) for text in texts]
+        irs = [audit.corrected_ir for audit in audits]
+        initial_states = [
+            PegInHoleState(position_m=0.0, velocity_mps=0.0, depth_goal_m=ir.hole.depth_m) for ir in irs
+        ]
+        logs = self.simulator.run_batch(irs, initial_states)
+        return [
+            PipelineResult(
+                instruction=text,
+                ir=audit.corrected_ir,
+                audit_notes=audit.observations,
+                episode_log=log,
+                metrics=compute_metrics(audit.corrected_ir, log),
+            )
+            for text, audit, log in zip(texts, audits, logs)
+        ]
+
+
+_worker_pipeline: Optional[LanguageToActionPipeline] = None
+
+
+def _init_worker(
+    controller_config: ControllerConfig,
+    use_remote_llm: bool,
+    sim_config: SimulationConfig,
+    auditor: MechanicsAuditor,
+) -> None:
+    global _worker_pipeline
+    _worker_pipeline = LanguageToActionPipeline(controller_config=controller_config, use_remote_llm=use_remote_llm)
+    _worker_pipeline.simulator.config = sim_config
+    _worker_pipeline.auditor = auditor
+
+
+def _process_in_worker(instruction: str) -> PipelineResult:
+    return _worker_pipeline._process_uncached(instruction)
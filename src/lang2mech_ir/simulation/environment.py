@@ -3,10 +3,13 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import List
+from typing import List, Sequence
+
+import numpy as np
 
 from ..ir_schema import MechanicsIR
 from ..controller import PegInHoleState, ControllerConfig, PegInHoleMPC
+from ..controller.mpc import BlockMPCSolver
 
 
 @dataclass
@@ -17,20 +20,79 @@ class SimulationConfig:
     contact_damping: float = 200.0
 
 
-@dataclass
+_CHANNELS = ("times_s", "positions_m", "velocities_mps", "controls_mps2", "contact_forces_N")
+
+
+def _empty() -> np.ndarray:
+    return np.empty(0, dtype=np.float64)
+
+
+@dataclass(slots=True, eq=False)
 class EpisodeLog:
-    times_s: List[float] = field(default_factory=list)
-    positions_m: List[float] = field(default_factory=list)
-    velocities_mps: List[float] = field(default_factory=list)
-    controls_mps2: List[float] = field(default_factory=list)
-    contact_forces_N: List[float] = field(default_factory=list)
+    """Per-step episode channels stored as float arrays.
+
+    ``append`` writes into buffers sized by ``reserve`` (growing them
+    geometrically when full); ``finalize`` trims every channel to the number
+    of logged steps once recording is done.
+    """
+
+    times_s: np.ndarray = field(default_factory=_empty)
+    positions_m: np.ndarray = field(default_factory=_empty)
+    velocities_mps: np.ndarray = field(default_factory=_empty)
+    controls_mps2: np.ndarray = field(default_factory=_empty)
+    contact_forces_N: np.ndarray = field(default_factory=_empty)
+    _size: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        for name in _CHANNELS:
+            setattr(self, name, np.asarray(getattr(self, name), dtype=np.float64))
+        self._size = self.times_s.size
+
+    def __eq__(self, other: object) -> bool:
+        # The generated __eq__ would compare arrays element-wise and fail on
+        # the ambiguous truth value; compare the logged steps instead.
+        if not isinstance(other, EpisodeLog):
+            return NotImplemented
+        size = self._size
+        return size == other._size and all(
+            np.array_equal(getattr(self, name)[:size], getattr(other, name)[:size]) for name in _CHANNELS
+        )
+
+    def copy(self) -> EpisodeLog:
+        """Return an independent log holding copies of the logged steps."""
+
+        size = self._size
+        return EpisodeLog(**{name: getattr(self, name)[:size].copy() for name in _CHANNELS})
+
+    def reserve(self, capacity: int) -> None:
+        """Make room for at least *capacity* steps without reallocating."""
+
+        if capacity <= self.times_s.size:
+            return
+        size = self._size
+        for name in _CHANNELS:
+            buffer = np.empty(capacity, dtype=np.float64)
+            buffer[:size] = getattr(self, name)[:size]
+            setattr(self, name, buffer)
 
     def append(self, t: float, state: PegInHoleState, control: float, contact_force: float) -> None:
-        self.times_s.append(t)
-        self.positions_m.append(state.position_m)
-        self.velocities_mps.append(state.velocity_mps)
-        self.controls_mps2.append(control)
-        self.contact_forces_N.append(contact_force)
+        idx = self._size
+        if idx == self.times_s.size:
+            self.reserve(max(16, 2 * idx))
+        self.times_s[idx] = t
+        self.positions_m[idx] = state.position_m
+        self.velocities_mps[idx] = state.velocity_mps
+        self.controls_mps2[idx] = control
+        self.contact_forces_N[idx] = contact_force
+        self._size = idx + 1
+
+    def finalize(self) -> EpisodeLog:
+        """Trim every channel to the logged steps and return ``self``."""
+
+        size = self._size
+        for name in _CHANNELS:
+            setattr(self, name, getattr(self, name)[:size])
+        return self
 
 
 @dataclass
@@ -39,38 +101,134 @@ class SimpleInsertionSimulator:
 
     config: SimulationConfig = field(default_factory=SimulationConfig)
 
+    def __post_init__(self) -> None:
+        # Reused across episodes so the OSQP setup/factorization is paid once.
+        self._controller = PegInHoleMPC(self.config.controller)
+
     def run_episode(self, ir: MechanicsIR, initial_state: PegInHoleState) -> EpisodeLog:
-        controller = PegInHoleMPC(self.config.controller)
+        controller = self._controller
+        if controller.config is not self.config.controller:
+            controller = self._controller = PegInHoleMPC(self.config.controller)
+        controller.reset()
         state = PegInHoleState(
             position_m=initial_state.position_m,
             velocity_mps=initial_state.velocity_mps,
             depth_goal_m=initial_state.depth_goal_m,
             timestamp_s=initial_state.timestamp_s,
         )
-        log = EpisodeLog()
         dt = self.config.controller.timestep_s
         t = state.timestamp_s
+        log = EpisodeLog()
+        log.reserve(max(0, int((self.config.max_time_s - t) / dt)) + 2)
         goal = ir.hole.depth_m
-        mass = self.config.controller.mass_kg
-
-        while t <= self.config.max_time_s:
+        max_time = self.config.max_time_s
+        max_force = ir.max_force.maximum
+        spring = self.config.contact_spring
+        damping = self.config.contact_damping
+        pos = state.position_m
+        vel = state.velocity_mps
+
+        while t <= max_time:
             control = controller.compute_control(ir, state)
             # Integrate dynamics (simple Euler step)
-            state.velocity_mps += dt * control
-            state.position_m += dt * state.velocity_mps
+            vel += dt * control
+            pos += dt * vel
 
-            penetration = max(0.0, state.position_m - goal)
-            contact_force = self.config.contact_spring * penetration + self.config.contact_damping * max(0.0, state.velocity_mps)
-            if contact_force > ir.max_force.maximum:
-                contact_force = ir.max_force.maximum
+            penetration = max(0.0, pos - goal)
+            contact_force = spring * penetration + damping * max(0.0, vel)
+            if contact_force > max_force:
+                contact_force = max_force
                 # reflect excessive penetration
-                state.position_m = goal + contact_force / self.config.contact_spring
+                pos = goal + contact_force / spring
 
             t += dt
+            state.position_m = pos
+            state.velocity_mps = vel
             state.timestamp_s = t
             log.append(t, state, control, contact_force)
 
-            if penetration <= 1e-4 and abs(state.position_m - goal) < 1e-3 and abs(state.velocity_mps) < 1e-3:
+            # Chained comparisons avoid two abs() calls per step. The penetration
+            # test stays: it uses the pre-reflection position, so it is not implied.
+            if penetration <= 1e-4 and -1e-3 < pos - goal < 1e-3 and -1e-3 < vel < 1e-3:
                 break
 
-        return log
+        return log.finalize()
+
+    def run_batch(self, irs: Sequence[MechanicsIR], initial_states: Sequence[PegInHoleState]) -> List[EpisodeLog]:
+        """Simulate several episodes in lockstep with one stacked MPC solve per step.
+
+        Every episode shares this simulator's controller configuration, so the
+        per-episode QPs are stacked into one block-diagonal problem (as in
+        ``MultiJointMPC``) and the dynamics are stepped as arrays. Finished
+        episodes keep their final state, which keeps the QP structure fixed.
+        """
+
+        if len(irs) != len(initial_states):
+            raise ValueError("irs and initial_states must have the same length")
+        if not irs:
+            return []
+
+        controller = PegInHoleMPC(self.config.controller)
+        states = [
+            PegInHoleState(
+                position_m=state.position_m,
+                velocity_mps=state.velocity_mps,
+                depth_goal_m=state.depth_goal_m,
+                timestamp_s=state.timestamp_s,
+            )
+            for state in initial_states
+        ]
+        dt = self.config.controller.timestep_s
+        max_time = self.config.max_time_s
+        spring = self.config.contact_spring
+        damping = self.config.contact_damping
+        goal = np.array([ir.hole.depth_m for ir in irs], dtype=np.float64)
+        max_force = np.array([ir.max_force.maximum for ir in irs], dtype=np.float64)
+        pos = np.array([state.position_m for state in states], dtype=np.float64)
+        vel = np.array([state.velocity_mps for state in states], dtype=np.float64)
+        t = np.array([state.timestamp_s for state in states], dtype=np.float64)
+
+        count = len(states)
+        capacity = max(0, int((max_time - t.min()) / dt)) + 2
+        # One (episode, step) row per log channel, in _CHANNELS order.
+        buffers = np.empty((len(_CHANNELS), count, capacity), dtype=np.float64)
+        lengths = np.zeros(count, dtype=np.intp)
+        active = t <= max_time
+        solver = BlockMPCSolver()
+        controllers = [controller] * count
+        step = 0
+
+        while active.any():
+            for state, position, velocity in zip(states, pos.tolist(), vel.tolist()):
+                state.position_m = position
+                state.velocity_mps = velocity
+            plans = solver.plan(controllers, irs, states)
+            control = np.array([plan.first_control() for plan in plans])
+
+            # Integrate dynamics (simple Euler step)
+            next_vel = vel + dt * control
+            next_pos = pos + dt * next_vel
+            penetration = np.maximum(0.0, next_pos - goal)
+            contact_force = spring * penetration + damping * np.maximum(0.0, next_vel)
+            excessive = contact_force > max_force
+            contact_force = np.where(excessive, max_force, contact_force)
+            # reflect excessive penetration
+            next_pos = np.where(excessive, goal + contact_force / spring, next_pos)
+            next_t = t + dt
+
+            if step == buffers.shape[2]:
+                buffers = np.concatenate((buffers, np.empty_like(buffers)), axis=2)
+            buffers[:, active, step] = np.stack((next_t, next_pos, next_vel, control, contact_force))[:, active]
+            lengths[active] = step + 1
+            step += 1
+
+            pos = np.where(active, next_pos, pos)
+            vel = np.where(active, next_vel, vel)
+            t = np.where(active, next_t, t)
+            settled = (penetration <= 1e-4) & (np.abs(next_pos - goal) < 1e-3) & (np.abs(next_vel) < 1e-3)
+            active &= ~settled & (t <= max_time)
+
+        return [
+            EpisodeLog(**{name: buffers[channel, idx, :size] for channel, name in enumerate(_CHANNELS)})
+            for idx, size in enumerate(lengths.tolist())
+        ]
@@ -2,10 +2,14 @@
 
 from __future__ import annotations
 
+import copy
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Sequence
 
+import numpy as np
+
 from ..controller import PegInHoleState, JointSpaceState
 
 
@@ -15,6 +19,13 @@ except ImportError:  # pragma: no cover - optional dependency
     mujoco = None
 
 
+@lru_cache(maxsize=8)
+def _load_model(path: str, mtime_ns: int) -> "mujoco.MjModel":
+    """Compile the MJCF at *path* once per file version; ``mtime_ns`` keys edits."""
+
+    return mujoco.MjModel.from_xml_path(path)
+
+
 @dataclass
 class MujocoPegInHoleConfig:
     model_path: Path
@@ -26,19 +37,29 @@ class MujocoPegInHoleConfig:
 
 
 class MujocoPegInHoleEnv:
-    """Minimal facade around MuJoCo's C API/`mujoco` Python bindings."""
+    """Minimal facade around MuJoCo's C API/`mujoco` Python bindings.
+
+    ``data`` is the live ``MjData``. Derived quantities such as the contact
+    force are recomputed lazily after :meth:`reset` and :meth:`step`; code that
+    edits ``data`` directly (or calls ``mujoco.mj_forward`` on it) must call
+    :meth:`invalidate` before reading them.
+    """
 
     def __init__(self, config: MujocoPegInHoleConfig) -> None:
         if mujoco is None:
             raise RuntimeError("MuJoCo python bindings are not installed. Please `pip install mujoco`.")
         self.config = config
-        self.model = mujoco.MjModel.from_xml_path(str(config.model_path))
+        # The MJCF is compiled once per file version; each environment gets its
+        # own copy so edits to ``self.model`` (e.g. ``opt.timestep``) stay local.
+        model_path = Path(config.model_path).resolve()
+        self.model = copy.copy(_load_model(str(model_path), model_path.stat().st_mtime_ns))
         self.data = mujoco.MjData(self.model)
         self.renderer = None
         if config.enable_render:
             self.renderer = mujoco.Renderer(self.model)
         self.control_counter = 0
         self.control_interval = max(1, int(config.control_timestep_s / config.sim_timestep_s))
+        self._step_accepts_nstep = True
         self.joint_ids = [
             mujoco.mj_name2id(self.model, mujoco.mjtObj.mjOBJ_JOINT, name)
             for name in config.joint_names
@@ -49,10 +70,17 @@ class MujocoPegInHoleEnv:
         ]
         if len(self.joint_ids) != len(self.actuator_ids):
             raise ValueError("joint_names and actuator_names must have the same length")
+        # Index arrays let ctrl/qpos/qvel be read and written with one slice.
+        self._joint_idx = np.asarray(self.joint_ids, dtype=np.intp)
+        self._actuator_idx = np.asarray(self.actuator_ids, dtype=np.intp)
         self._goal_positions = [0.0] * len(self.joint_ids)
+        # Set whenever the simulation state changes; cleared once the
+        # constraint forces have been recomputed for that state.
+        self._post_constraint_dirty = True
 
     def reset(self, goal_positions: Optional[Sequence[float]] = None) -> JointSpaceState:
         mujoco.mj_resetData(self.model, self.data)
+        self.invalidate()
         self.control_counter = 0
         if goal_positions is not None:
             if len(goal_positions) != len(self.joint_ids):
@@ -69,14 +97,29 @@ class MujocoPegInHoleEnv:
             controls = [float(control_input)] * len(self.actuator_ids)
         if len(controls) != len(self.actuator_ids):
             raise ValueError("Control dimension must match actuator count")
-        for aid, ctrl in zip(self.actuator_ids, controls):
-            self.data.ctrl[aid] = ctrl
-        steps = self.control_interval
-        for _ in range(steps):
-            mujoco.mj_step(self.model, self.data)
+        self.data.ctrl[self._actuator_idx] = controls
+        self._advance(self.control_interval)
+        self.invalidate()
         self.control_counter += 1
         return self.get_joint_state()
 
+    def invalidate(self) -> None:
+        """Mark derived quantities stale after ``data`` was changed outside :meth:`step`."""
+
+        self._post_constraint_dirty = True
+
+    def _advance(self, steps: int) -> None:
+        # Recent bindings step `nstep` times in one C call; older ones reject
+        # the keyword (before stepping), after which we fall back to a loop.
+        if self._step_accepts_nstep:
+            try:
+                mujoco.mj_step(self.model, self.data, nstep=steps)
+                return
+            except TypeError:
+                self._step_accepts_nstep = False
+        for _ in range(steps):
+            mujoco.mj_step(self.model, self.data)
+
     def render(self) -> bytes | None:  # pragma: no cover - requires GL context
         if not self.renderer:
             return None
@@ -89,13 +132,15 @@ class MujocoPegInHoleEnv:
         self._goal_positions = list(goals)
 
     def get_contact_force(self) -> float:
-        mujoco.mj_rnePostConstraint(self.model, self.data)
+        if self._post_constraint_dirty:
+            mujoco.mj_rnePostConstraint(self.model, self.data)
+            self._post_constraint_dirty = False
         if not self.joint_ids:
             return 0.0
         return float(abs(self.data.qfrc_constraint[self.joint_ids[-1]]))
 
     def get_joint_state(self) -> JointSpaceState:
-        positions = [float(self.data.qpos[j]) for j in self.joint_ids]
-        velocities = [float(self.data.qvel[j]) for j in self.joint_ids]
+        positions = self.data.qpos[self._joint_idx].tolist()
+        velocities = self.data.qvel[self._joint_idx].tolist()
         sim_time = float(self.data.time)
         return JointSpaceState(joint_positions=positions, joint_velocities=velocities, goal_positions=self._goal_positions, timestamp_s=sim_time)
@@ -51,20 +51,21 @@ def run_mujoco_episode(
         multi_config = MultiJointMPCConfig(joint_count=joint_count)
     controller = MultiJointMPC(multi_config)
     log = EpisodeLog()
+    log.reserve(steps)
+    # The logged tip state is overwritten every step rather than reallocated.
+    tip_state = PegInHoleState(position_m=0.0, velocity_mps=0.0, depth_goal_m=goals[-1])
 
     for _ in range(steps):
         plan = controller.plan(state)
         controls = plan.first_controls()
         state = env.step(controls, state)
         contact_force = env.get_contact_force()
-        tip_state = PegInHoleState(
-            position_m=state.joint_positions[-1],
-            velocity_mps=state.joint_velocities[-1],
-            depth_goal_m=state.goal_positions[-1],
-            timestamp_s=state.timestamp_s,
-        )
+        tip_state.position_m = state.joint_positions[-1]
+        tip_state.velocity_mps = state.joint_velocities[-1]
+        tip_state.depth_goal_m = state.goal_positions[-1]
+        tip_state.timestamp_s = state.timestamp_s
         log.append(state.timestamp_s, tip_state, controls[-1], contact_force)
         if abs(tip_state.position_m - tip_state.depth_goal_m) < 1e-3 and abs(tip_state.velocity_mps) < 1e-3:
             break
 
-    return log
+    return log.finalize()
@@ -5,12 +5,15 @@ from __future__ import annotations
 import math
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Mapping
 
 
 _VALUE_RE = re.compile(r"(?P<value>[-+]?\d*\.?\d+(?:[eE][-+]?\d+)?)\s*(?P<unit>[A-Za-z0-9°/\^]+)?")
+_search_value = _VALUE_RE.search
 
 
+@lru_cache(maxsize=256)
 def _normalize_unit(token: str) -> str:
     token = token.strip().lower()
     token = token.replace("degrees", "deg").replace("degree", "deg").replace("°", "deg")
@@ -41,21 +44,37 @@ def _as_mapping(value: Any) -> Mapping[str, Any] | None:
     return value if isinstance(value, Mapping) else None
 
 
+@lru_cache(maxsize=4096)
+def _parse_quantity(value: str) -> tuple[float, str | None]:
+    """Split a quantity string into ``(amount, unit)``; memoized per string."""
+
+    # Bare numbers ("0.01") skip the regex; float() also accepts "inf",
+    # "nan" and "1_000", which are left to the regex (and rejected).
+    try:
+        amount = float(value)
+    except ValueError:
+        pass
+    else:
+        if math.isfinite(amount) and "_" not in value:
+            return amount, None
+    match = _search_value(value)
+    if not match:
+        raise UnitConversionError(f"Could not parse quantity from '{value}'.")
+    amount = float(match.group("value"))
+    unit = match.group("unit")
+    if unit:
+        unit = unit.strip()
+    else:
+        remainder = value[match.end():].strip()
+        unit = remainder or None
+    return amount, unit
+
+
 def _extract_amount_and_unit(value: Any) -> tuple[float, str | None]:
     if isinstance(value, (int, float)):
         return float(value), None
     if isinstance(value, str):
-        match = _VALUE_RE.search(value)
-        if not match:
-            raise UnitConversionError(f"Could not parse quantity from '{value}'.")
-        amount = float(match.group("value"))
-        unit = match.group("unit")
-        if unit:
-            unit = unit.strip()
-        else:
-            remainder = value[match.end():].strip()
-            unit = remainder or None
-        return amount, unit
+        return _parse_quantity(value)
     mapping_value = _as_mapping(value)
     if mapping_value is None:
         raise UnitConversionError(f"Unsupported quantity type: {type(value)!r}")
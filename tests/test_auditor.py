@@ -36,3 +36,17 @@ def test_auditor_handles_force_bounds_and_tolerances():
     assert result.corrected_ir.max_force.minimum is None
     assert result.corrected_ir.tolerances.alignment_deg <= 5.0
     assert result.corrected_ir.tolerances.position_m == pytest.approx(5e-4)
+
+
+def test_auditor_copy_flag_controls_in_place_correction():
+    ir = MechanicsIR()
+    ir.trajectory.insertion_speed_mps = 0.08
+    auditor = MechanicsAuditor()
+
+    copied = auditor.audit(ir)
+    assert copied.corrected_ir is not ir
+    assert ir.trajectory.insertion_speed_mps == pytest.approx(0.08)
+
+    in_place = auditor.audit(ir, copy=False)
+    assert in_place.corrected_ir is ir
+    assert ir.trajectory.insertion_speed_mps == pytest.approx(auditor.max_speed_mps)
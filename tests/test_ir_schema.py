@@ -0,0 +1,40 @@
+from lang2mech_ir import ConstraintBounds, MechanicsIR
+
+
+def test_ir_copy_is_independent():
+    ir = MechanicsIR()
+    ir.metadata["source"] = {"model": "heuristic"}
+    ir.notes.append("original")
+
+    clone = ir.copy()
+    clone.peg.radius_m = 0.01
+    clone.max_force.maximum = 3.0
+    clone.metadata["source"]["model"] = "remote"
+    clone.notes.append("clone")
+
+    assert clone == MechanicsIR.from_dict(clone.to_dict())
+    assert ir.peg.radius_m == 0.005
+    assert ir.max_force.maximum == 20.0
+    assert ir.metadata == {"source": {"model": "heuristic"}}
+    assert ir.notes == ["original"]
+
+
+def test_ir_from_dict_merges_partial_payload():
+    ir = MechanicsIR.from_dict({"peg": {"radius_m": 0.004}, "max_force": {"maximum": 8.0}, "notes": ["n"]})
+
+    assert ir.peg.radius_m == 0.004
+    assert ir.peg.length_m == MechanicsIR().peg.length_m
+    assert ir.max_force.maximum == 8.0
+    assert ir.max_force.units == "N"
+    assert ir.notes == ["n"]
+
+
+def test_constraint_bounds_clamp_tracks_updated_bounds():
+    bounds = ConstraintBounds(maximum=10.0, units="N")
+    assert bounds.clamp(12.0) == 10.0
+    assert bounds.clamp(-3.0) == -3.0
+
+    bounds.minimum = 0.0
+    bounds.maximum = None
+    assert bounds.clamp(-3.0) == 0.0
+    assert bounds.clamp(50.0) == 50.0
@@ -37,3 +37,16 @@ def test_llm_interface_detects_strategy_and_speeds():
     assert ir.trajectory.retraction_speed_mps == pytest.approx(0.005)
     assert ir.tolerances.clearance_m == pytest.approx(0.00005)
     assert ir.time_limit_s == pytest.approx(8.0)
+
+
+def test_llm_interface_compile_returns_independent_copies():
+    interface = LLMInterface()
+    instruction = "Insert the 6 mm peg carefully, max force 6 N."
+
+    first = interface.compile(instruction)
+    first.max_force.maximum = 99.0
+    first.notes.append("mutated")
+    second = interface.compile(instruction)
+
+    assert second.max_force.maximum == pytest.approx(6.0)
+    assert "mutated" not in second.notes
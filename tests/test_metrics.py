@@ -1,5 +1,6 @@
 from lang2mech_ir import MechanicsIR
 from lang2mech_ir.logging_utils import compute_metrics
+from lang2mech_ir.controller import PegInHoleState
 from lang2mech_ir.simulation import EpisodeLog
 
 
@@ -33,3 +34,26 @@ def test_metrics_force_violation():
     metrics = compute_metrics(ir, log)
     assert metrics.success is False
     assert metrics.force_violation is True
+
+
+def test_episode_log_append_grows_and_finalizes():
+    log = EpisodeLog()
+    log.reserve(2)
+    for step in range(20):
+        state = PegInHoleState(position_m=0.001 * step, velocity_mps=0.01, depth_goal_m=0.05)
+        log.append(0.02 * step, state, 1.0, float(step))
+    log.finalize()
+
+    assert len(log.times_s) == 20
+    assert log.positions_m[-1] == 0.019
+    assert log.contact_forces_N.max() == 19.0
+
+
+def test_episode_log_equality_compares_logged_steps():
+    log = EpisodeLog()
+    log.reserve(8)
+    log.append(0.0, PegInHoleState(position_m=1.0, velocity_mps=0.0, depth_goal_m=0.05), 0.0, 0.0)
+
+    assert EpisodeLog([1.0, 2.0]) == EpisodeLog([1.0, 2.0])
+    assert EpisodeLog([1.0, 2.0]) != EpisodeLog([1.0, 3.0])
+    assert log == EpisodeLog([0.0], [1.0], [0.0], [0.0], [0.0])
@@ -1,7 +1,17 @@
 import numpy as np
+import osqp
+import pytest
 
 from lang2mech_ir import MechanicsIR
-from lang2mech_ir.controller import PegInHoleState, PegInHoleMPC, ControllerConfig
+from lang2mech_ir.controller import (
+    ControllerConfig,
+    JointSpaceState,
+    MultiJointMPC,
+    MultiJointMPCConfig,
+    MultiJointMPCPlan,
+    PegInHoleMPC,
+    PegInHoleState,
+)
 
 
 def make_ir(max_force: float = 10.0, insertion_speed: float = 0.01):
@@ -12,6 +22,21 @@ def make_ir(max_force: float = 10.0, insertion_speed: float = 0.01):
     return ir
 
 
+def count_osqp_calls(monkeypatch):
+    """Count OSQP setups and solves made through any controller."""
+
+    calls = {"setup": 0, "solve": 0}
+    for name in calls:
+        method = getattr(osqp.OSQP, name)
+
+        def counting(self, *args, _name=name, _method=method, **kwargs):
+            calls[_name] += 1
+            return _method(self, *args, **kwargs)
+
+        monkeypatch.setattr(osqp.OSQP, name, counting)
+    return calls
+
+
 def test_mpc_respects_force_limit():
     config = ControllerConfig(horizon=5, timestep_s=0.05, mass_kg=2.0)
     controller = PegInHoleMPC(config)
@@ -31,3 +56,140 @@ def test_mpc_tracks_goal_depth():
     plan = controller.plan(ir, state)
     assert plan.predicted_positions[-1] > 0.0
     assert plan.predicted_positions[-1] <= ir.hole.depth_m + 1e-3
+
+
+def test_mpc_reuses_solver_across_states(monkeypatch):
+    controller = PegInHoleMPC()
+    ir = make_ir(max_force=20.0)
+    second_state = PegInHoleState(position_m=0.01, velocity_mps=0.005, depth_goal_m=ir.hole.depth_m)
+    reference = PegInHoleMPC().plan(ir, second_state)
+    calls = count_osqp_calls(monkeypatch)
+
+    controller.plan(ir, PegInHoleState(position_m=0.0, velocity_mps=0.0, depth_goal_m=ir.hole.depth_m))
+    plan = controller.plan(ir, second_state)
+
+    assert calls == {"setup": 1, "solve": 2}
+    assert plan.cost is not None
+    assert np.allclose(plan.control_sequence, reference.control_sequence, atol=1e-2)
+
+
+def test_mpc_caches_qp_matrices_per_config():
+    controller = PegInHoleMPC()
+    ir = make_ir(max_force=20.0)
+
+    first = controller._build_qp(ir, PegInHoleState(position_m=0.0, velocity_mps=0.0, depth_goal_m=0.05))
+    second = controller._build_qp(ir, PegInHoleState(position_m=0.01, velocity_mps=0.005, depth_goal_m=0.05))
+    assert second.P is first.P and second.A is first.A
+
+    controller.config.horizon = 6
+    resized = controller._build_qp(ir, PegInHoleState(position_m=0.0, velocity_mps=0.0, depth_goal_m=0.05))
+    assert resized.P.shape == (12, 12)
+    assert resized.A.shape == (30, 12)
+
+
+def test_mpc_plan_batch_matches_individual_plans():
+    controller = PegInHoleMPC()
+    irs = [make_ir(max_force=4.0), make_ir(max_force=20.0, insertion_speed=0.02)]
+    states = [
+        PegInHoleState(position_m=0.0, velocity_mps=0.0, depth_goal_m=0.05),
+        PegInHoleState(position_m=0.02, velocity_mps=0.01, depth_goal_m=0.05),
+    ]
+
+    batch = controller.plan_batch(irs, states)
+    single = [PegInHoleMPC().plan(ir, state) for ir, state in zip(irs, states)]
+
+    assert len(batch) == 2
+    for batched, reference in zip(batch, single):
+        assert np.allclose(batched.control_sequence, reference.control_sequence, atol=1e-2)
+        assert batched.cost == pytest.approx(reference.cost, rel=1e-2, abs=1e-4)
+
+
+def test_multi_joint_mpc_matches_per_joint_plans():
+    config = MultiJointMPCConfig(joint_count=3, masses=[1.0, 2.0, 3.0], max_forces=[5.0, 10.0, 15.0])
+    controller = MultiJointMPC(config)
+    state = JointSpaceState(
+        joint_positions=[0.0, 0.01, 0.02],
+        joint_velocities=[0.0, 0.0, 0.01],
+        goal_positions=[0.0, 0.03, 0.05],
+    )
+
+    plan = controller.plan(state)
+
+    assert plan.control_sequences.shape == (3, config.horizon)
+    assert plan.first_controls() == plan.control_sequences[:, 0].tolist()
+    for idx in range(3):
+        single = PegInHoleMPC(controller._single_controller_config(idx)).plan(
+            controller._single_ir(idx, state.goal_positions[idx]),
+            PegInHoleState(
+                position_m=state.joint_positions[idx],
+                velocity_mps=state.joint_velocities[idx],
+                depth_goal_m=state.goal_positions[idx],
+            ),
+        )
+        assert len(plan.control_sequences[idx]) == config.horizon
+        assert np.allclose(plan.control_sequences[idx], single.control_sequence, atol=1e-2)
+
+
+def test_multi_joint_mpc_reuses_stacked_solver(monkeypatch):
+    controller = MultiJointMPC(MultiJointMPCConfig(joint_count=2))
+    state = JointSpaceState(joint_positions=[0.0, 0.0], joint_velocities=[0.0, 0.0], goal_positions=[0.0, 0.05])
+    calls = count_osqp_calls(monkeypatch)
+
+    controller.plan(state)
+    state.joint_positions = [0.0, 0.01]
+    plan = controller.plan(state)
+
+    assert calls == {"setup": 1, "solve": 2}
+    assert all(cost is not None for cost in plan.costs)
+
+
+def test_multi_joint_mpc_keeps_healthy_joints_when_one_is_infeasible():
+    controller = MultiJointMPC(MultiJointMPCConfig(joint_count=2))
+    state = JointSpaceState(joint_positions=[0.0, 0.0], joint_velocities=[0.0, 5.0], goal_positions=[0.05, 0.05])
+
+    plan = controller.plan(state)
+    single = PegInHoleMPC(controller._single_controller_config(0)).plan(
+        controller._single_ir(0, 0.05), PegInHoleState(position_m=0.0, velocity_mps=0.0, depth_goal_m=0.05)
+    )
+
+    assert plan.costs[0] is not None
+    assert np.allclose(plan.control_sequences[0], single.control_sequence, atol=1e-2)
+    assert plan.costs[1] is None
+    assert not plan.control_sequences[1].any()
+
+
+def test_multi_joint_plan_first_controls_handles_empty_sequences():
+    assert MultiJointMPCPlan().first_controls() == []
+    assert MultiJointMPCPlan(control_sequences=np.empty((2, 0))).first_controls() == [0.0, 0.0]
+
+
+def test_mpc_skips_solver_when_unconstrained_optimum_is_feasible(monkeypatch):
+    controller = PegInHoleMPC(ControllerConfig())
+    ir = MechanicsIR()
+    state = PegInHoleState(position_m=0.049, velocity_mps=0.0, depth_goal_m=0.05)
+    calls = count_osqp_calls(monkeypatch)
+
+    plan = controller.plan(ir, state)
+
+    assert calls == {"setup": 0, "solve": 0}
+    qp = controller._build_qp(ir, state)
+    reference = osqp.OSQP()
+    reference.setup(qp.P, qp.q, qp.A, qp.l, qp.u, verbose=False, eps_abs=1e-9, eps_rel=1e-9)
+    result = reference.solve()
+    assert np.allclose(plan.control_sequence, result.x[: controller.config.horizon], atol=1e-6)
+
+
+def test_plan_batch_falls_back_per_item_when_stacked_solve_fails():
+    controller = PegInHoleMPC(ControllerConfig())
+    irs = [MechanicsIR(), MechanicsIR()]
+    states = [
+        PegInHoleState(position_m=0.0, velocity_mps=0.0, depth_goal_m=0.05),
+        PegInHoleState(position_m=0.0, velocity_mps=5.0, depth_goal_m=0.05),
+    ]
+
+    plans = controller.plan_batch(irs, states)
+    single = PegInHoleMPC(ControllerConfig()).plan(irs[0], states[0])
+
+    assert plans[0].cost is not None
+    assert np.allclose(plans[0].control_sequence, single.control_sequence, atol=1e-2)
+    assert plans[1].cost is None
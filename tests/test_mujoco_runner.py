@@ -3,6 +3,7 @@ import pytest
 from pathlib import Path
 
 from lang2mech_ir import MechanicsIR
+from lang2mech_ir.simulation.mujoco_interface import MujocoPegInHoleConfig, MujocoPegInHoleEnv
 from lang2mech_ir.simulation.mujoco_runner import run_mujoco_episode
 
 mujoco = pytest.importorskip("mujoco")
@@ -17,3 +18,13 @@ def test_run_mujoco_episode_smoke(tmp_path):
     log = run_mujoco_episode(ir, model_path, steps=50)
     assert len(log.times_s) > 0
     assert log.positions_m[-1] <= 0.12
+
+
+def test_mujoco_envs_do_not_share_model_edits():
+    config = MujocoPegInHoleConfig(model_path=Path("assets/peg_in_hole.xml").resolve())
+    first = MujocoPegInHoleEnv(config)
+    second = MujocoPegInHoleEnv(config)
+
+    first.model.opt.timestep = 0.005
+
+    assert second.model.opt.timestep == pytest.approx(0.001)
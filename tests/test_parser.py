@@ -60,3 +60,23 @@ def test_parser_normalizes_units_and_defaults():
     assert ir.environment.temperature_c == pytest.approx(26.0)
     # Notes should mention at least one assumed unit (length in meters by default)
     assert any("peg.length" in note for note in ir.notes)
+
+
+def test_parser_dispatches_to_overridden_appliers():
+    class FixedPegParser(InstructionParser):
+        def _apply_peg_fields(self, payload, ir, notes):
+            ir.peg.radius_m = 0.123
+
+    ir = FixedPegParser().parse({"peg": {"radius": "5 mm"}})
+
+    assert ir.peg.radius_m == 0.123
+
+
+def test_parser_overridden_appliers_can_read_new_keys():
+    class LabelParser(InstructionParser):
+        def _apply_task_fields(self, payload, ir, notes):
+            super()._apply_task_fields(payload, ir, notes)
+            if "label" in payload:
+                ir.task_name = payload["label"]
+
+    assert LabelParser().parse({"label": "custom"}).task_name == "custom"
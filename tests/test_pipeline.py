@@ -1,3 +1,6 @@
+import osqp
+import pytest
+
 from lang2mech_ir.pipeline import LanguageToActionPipeline
 
 
@@ -10,3 +13,132 @@ def test_pipeline_runs_single_instruction():
     assert len(result.audit_notes) >= 1
     assert len(result.episode_log.times_s) >= 1
     assert result.metrics.goal_depth_m == result.ir.hole.depth_m
+
+
+def test_pipeline_vectorized_batch_matches_sequential():
+    pipeline = LanguageToActionPipeline()
+    instructions = [
+        "Insert the 6 mm peg carefully, max force 6 N.",
+        "Quickly push the 10 mm pin into the 20 mm deep hole with at most 12 N.",
+    ]
+
+    sequential = pipeline.run_batch(instructions)
+    batched = pipeline.run_batch_vectorized(instructions)
+
+    assert len(batched) == len(sequential)
+    for fast, reference in zip(batched, sequential):
+        assert fast.metrics.success == reference.metrics.success
+        assert fast.metrics.final_depth_m == pytest.approx(reference.metrics.final_depth_m, abs=1e-4)
+        assert abs(len(fast.episode_log.times_s) - len(reference.episode_log.times_s)) <= 1
+
+
+def test_pipeline_reuses_simulator_controller(monkeypatch):
+    pipeline = LanguageToActionPipeline()
+    setups = []
+    setup = osqp.OSQP.setup
+
+    def counting_setup(self, *args, **kwargs):
+        setups.append(self)
+        return setup(self, *args, **kwargs)
+
+    monkeypatch.setattr(osqp.OSQP, "setup", counting_setup)
+
+    first = pipeline.process_instruction("Insert the 6 mm peg carefully, max force 6 N.")
+    pipeline.clear_cache()
+    second = pipeline.process_instruction("Insert the 6 mm peg carefully, max force 6 N.")
+
+    assert len(setups) == 1
+    assert second.metrics.final_depth_m == pytest.approx(first.metrics.final_depth_m)
+
+
+def count_episodes(monkeypatch, pipeline):
+    calls = []
+    run_episode = pipeline.simulator.run_episode
+
+    def counting_run_episode(ir, state):
+        calls.append(ir)
+        return run_episode(ir, state)
+
+    monkeypatch.setattr(pipeline.simulator, "run_episode", counting_run_episode)
+    return calls
+
+
+def test_pipeline_memoizes_repeated_instructions(monkeypatch):
+    pipeline = LanguageToActionPipeline()
+    episodes = count_episodes(monkeypatch, pipeline)
+    instruction = "Insert the 6 mm peg carefully, max force 6 N."
+
+    first = pipeline.process_instruction(instruction)
+    assert pipeline.process_instruction(instruction) == first
+    assert len(episodes) == 1
+
+    pipeline.controller_config.horizon = 5
+    pipeline.process_instruction(instruction)
+    assert len(episodes) == 2
+
+
+def test_pipeline_memoized_results_are_independent():
+    pipeline = LanguageToActionPipeline()
+    instruction = "Insert the 6 mm peg carefully, max force 6 N."
+
+    first = pipeline.process_instruction(instruction)
+    reference = first.copy()
+    first.ir.notes.append("edited by caller")
+    first.ir.hole.depth_m = 1.0
+    first.audit_notes.clear()
+    first.episode_log.positions_m[:] = -1.0
+    first.metrics.success = not first.metrics.success
+
+    assert pipeline.process_instruction(instruction) == reference
+
+
+def test_pipeline_memo_is_bounded_and_keyed_on_auditor(monkeypatch):
+    pipeline = LanguageToActionPipeline(cache_size=1)
+    episodes = count_episodes(monkeypatch, pipeline)
+    instruction = "Insert the 6 mm peg carefully, max force 6 N."
+
+    pipeline.process_instruction(instruction)
+    pipeline.process_instruction("Insert the peg 30 mm deep slowly")
+    pipeline.process_instruction(instruction)
+    assert len(episodes) == 3
+
+    pipeline.process_instruction(instruction)
+    assert len(episodes) == 3
+
+    pipeline.auditor.max_speed_mps = 0.001
+    pipeline.process_instruction(instruction)
+    assert len(episodes) == 4
+
+
+def test_pipeline_does_not_memoize_remote_results(monkeypatch):
+    monkeypatch.delenv("ANTHROPIC_API_KEY", raising=False)
+    pipeline = LanguageToActionPipeline(use_remote_llm=True)
+    episodes = count_episodes(monkeypatch, pipeline)
+    instruction = "Insert the 6 mm peg carefully, max force 6 N."
+
+    first = pipeline.process_instruction(instruction)
+    second = pipeline.process_instruction(instruction)
+    assert second.ir == first.ir
+    assert len(episodes) == 2
+
+
+def test_pipeline_parallel_batch_matches_sequential(monkeypatch):
+    instructions = [
+        "Insert the 6 mm peg carefully, max force 6 N.",
+        "Quickly push the 10 mm pin into the 20 mm deep hole with at most 12 N.",
+        "Insert the 6 mm peg carefully, max force 6 N.",
+    ]
+
+    sequential = LanguageToActionPipeline().run_batch(instructions)
+    pipeline = LanguageToActionPipeline()
+    parallel = pipeline.run_batch_parallel(instructions, max_workers=2)
+
+    parallel[0].ir.notes.append("edited by caller")
+    assert parallel[2].ir.notes != parallel[0].ir.notes
+    episodes = count_episodes(monkeypatch, pipeline)
+    assert pipeline.process_instruction(instructions[1]) == parallel[1]
+    assert not episodes
+    for fast, reference in zip(parallel, sequential):
+        assert fast.ir.max_force.maximum == reference.ir.max_force.maximum
+        assert fast.metrics.final_depth_m == pytest.approx(reference.metrics.final_depth_m)
+        assert len(fast.episode_log.times_s) == len(reference.episode_log.times_s)
@@ -31,3 +31,12 @@ def test_angle_and_acceleration_conversion():
 
     gravity = units.acceleration_to_mps2("981 cm/s^2")
     assert gravity.value == pytest.approx(9.81)
+
+
+def test_bare_numeric_string_uses_default_unit():
+    bare = units.length_to_m(" 12.5 ")
+    assert bare.value == pytest.approx(12.5)
+    assert bare.assumed_unit is True
+
+    with pytest.raises(units.UnitConversionError):
+        units.length_to_m("nan")